@@ -1,13 +1,31 @@
 # -*- coding: utf-8 -*-
 # api_clients.py
 
+import json
 import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
 import requests
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QRunnable, QObject, pyqtSignal
 
 # --- API Constants ---
 ASSET_LIB_API_BASE = "https://godotengine.org/asset-library/api"
 GITHUB_API_RELEASES = "https://api.github.com/repos/godotengine/godot/releases"
+DETAILS_FETCH_MAX_WORKERS = 8 # Upper bound on concurrent detail requests (API politeness)
+DETAILS_CACHE_TTL = 600 # Seconds a fetched asset detail stays valid in memory
+DETAILS_CACHE_MAX_SIZE = 256 # Maximum number of asset details kept in memory
+DETAILS_DB_FILE = Path("cache/asset_details.sqlite") # Persistent cache of asset details between runs
+DETAILS_DB_TTL = 86400 # Seconds a persisted asset detail stays valid on disk
+
+# In-memory cache of asset details: {asset_id: (fetch_time, details)}
+_details_cache = {}
+_details_cache_lock = threading.Lock() # Accessed from worker threads too
+
+# Lazily opened connection to the persistent details cache (shared by worker threads)
+_details_db = None
+_details_db_lock = threading.Lock()
 
 
 # --- Godot Asset Library API Client ---
@@ -135,6 +153,139 @@ def fetch_asset_details_sync(asset_id):
         return None
 
 
+def _get_details_db():
+    """Returns the connection to the persistent details cache, opening it on first use. Call with _details_db_lock held."""
+    global _details_db
+    if _details_db is None:
+        DETAILS_DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _details_db = sqlite3.connect(str(DETAILS_DB_FILE), check_same_thread=False)
+        _details_db.execute("CREATE TABLE IF NOT EXISTS asset_details (id TEXT PRIMARY KEY, ts INTEGER, json TEXT)")
+        _details_db.commit()
+    return _details_db
+
+
+def _load_details_from_db(key):
+    """Returns the persisted details of an asset if still fresh, otherwise None."""
+    try:
+        with _details_db_lock:
+            row = _get_details_db().execute(
+                "SELECT ts, json FROM asset_details WHERE id = ?", (key,)
+            ).fetchone()
+        if row and time.time() - row[0] < DETAILS_DB_TTL:
+            return json.loads(row[1])
+    except (sqlite3.Error, OSError, ValueError) as e:
+        logging.warning(f"Could not read asset details cache for ID {key}: {e}")
+    return None
+
+
+def _store_details_in_db(key, details):
+    """Persists the details of an asset, replacing any previous entry."""
+    try:
+        with _details_db_lock:
+            db = _get_details_db()
+            db.execute(
+                "INSERT OR REPLACE INTO asset_details (id, ts, json) VALUES (?, ?, ?)",
+                (key, int(time.time()), json.dumps(details)),
+            )
+            db.commit()
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logging.warning(f"Could not write asset details cache for ID {key}: {e}")
+
+
+def fetch_asset_details_cached(asset_id):
+    """
+    Returns the details of an asset, using the in-memory cache when the entry is still fresh,
+    then the persistent (SQLite) cache. Falls back to fetch_asset_details_sync() on a miss;
+    failed fetches are not cached.
+
+    Args:
+        asset_id: The ID of the asset to fetch details for.
+
+    Returns:
+        A copy of the asset details dictionary, or None if an error occurred.
+    """
+    key = str(asset_id)
+    now = time.monotonic()
+    with _details_cache_lock:
+        entry = _details_cache.get(key)
+        if entry and now - entry[0] < DETAILS_CACHE_TTL:
+            logging.debug(f"Details cache hit for asset ID {key}.")
+            return dict(entry[1]) # Copy, callers may modify the returned dict
+
+    details = _load_details_from_db(key)
+    if details:
+        logging.debug(f"Details disk cache hit for asset ID {key}.")
+    else:
+        details = fetch_asset_details_sync(asset_id)
+        if details:
+            _store_details_in_db(key, details)
+    if details:
+        with _details_cache_lock:
+            if len(_details_cache) >= DETAILS_CACHE_MAX_SIZE and key not in _details_cache:
+                # Evict the oldest entry
+                oldest_key = min(_details_cache, key=lambda k: _details_cache[k][0])
+                del _details_cache[oldest_key]
+            _details_cache[key] = (now, details)
+        return dict(details)
+    return None
+
+
+def clear_asset_details_cache():
+    """
+    Clears the in-memory asset details cache (e.g., on a user-initiated refresh).
+    The persistent cache keeps its valid rows; only entries past DETAILS_DB_TTL are pruned.
+    """
+    with _details_cache_lock:
+        _details_cache.clear()
+    try:
+        with _details_db_lock:
+            db = _get_details_db()
+            db.execute("DELETE FROM asset_details WHERE ts < ?", (int(time.time() - DETAILS_DB_TTL),))
+            db.commit()
+    except (sqlite3.Error, OSError) as e:
+        logging.warning(f"Could not prune expired asset details on disk: {e}")
+    logging.debug("Asset details cache cleared.")
+
+
+class AssetDetailsFetcherSignals(QObject):
+    """Container for signals emitted by AssetDetailsFetcher."""
+    finished = pyqtSignal(int, str, object, str) # batch_id, asset_id, details dict (or None), error_message
+
+
+class AssetDetailsFetcher(QRunnable):
+    """
+    A QRunnable task fetching the details of a single asset.
+
+    Several fetchers can be started on a QThreadPool to load many assets concurrently;
+    the batch_id lets the receiver discard results of a batch it is no longer waiting for.
+    """
+    def __init__(self, batch_id: int, asset_id):
+        """
+        Initializes the AssetDetailsFetcher.
+
+        Args:
+            batch_id: Identifier of the batch this request belongs to (echoed back in the signal).
+            asset_id: The ID of the asset to fetch details for.
+        """
+        super().__init__()
+        self.batch_id = batch_id
+        self.asset_id = str(asset_id)
+        self.signals = AssetDetailsFetcherSignals()
+
+    def run(self):
+        """Fetches the asset details and emits the result."""
+        details = None
+        error_msg = ""
+        try:
+            details = fetch_asset_details_cached(self.asset_id)
+            if not details:
+                error_msg = "Details not found"
+        except Exception as e:
+            logging.exception(f"Error fetching details for asset ID {self.asset_id}")
+            error_msg = f"API Error ({e})"
+        self.signals.finished.emit(self.batch_id, self.asset_id, details, error_msg)
+
+
 # --- GitHub API Client ---
 class GitHubReleasesThread(QThread):
     """
@@ -5,7 +5,8 @@ import json
 import logging
 from pathlib import Path
 import os
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 # --- Constants ---
 CONFIG_FILE = Path("launcher_data.json")
@@ -19,6 +20,7 @@ DEFAULT_ICON_NAME = "icon.svg"  # Used in project_handler
 DEFAULT_ICON_PATH_IN_LAUNCHER = (
     Path("assets") / DEFAULT_ICON_NAME
 )  # Used in project_handler
+SAVE_DEBOUNCE_SECONDS = 0.5  # Delay before a requested save is written (coalesces bursts of changes)
 
 
 class DataManager:
@@ -36,6 +38,11 @@ class DataManager:
         # Store the *unresolved* default path string. Resolution happens only if needed.
         self._default_godot_versions_path_str = str(DEFAULT_GODOT_VERSIONS_DIR)
         self._data: Dict[str, Any] = self._load_data()
+        # Debounced background saving (see request_save)
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_timer_lock = threading.Lock()
+        self._save_lock = threading.Lock() # Serializes writes to the config file
         logging.debug("DataManager initialized.")
 
     def _get_default_data(self) -> Dict[str, Any]:
@@ -110,6 +117,12 @@ class DataManager:
 
     def save_data(self):
         """Saves the current configuration data to the JSON file."""
+        with self._save_lock:
+            self._dirty = False
+            self._write_data()
+
+    def _write_data(self):
+        """Writes the JSON file; the caller must hold _save_lock."""
         logging.debug(f"Calling save_data() for {self.config_path}")
         try:
             # Ensure default keys exist before saving (redundant if _load_data worked, but safe)
@@ -123,15 +136,62 @@ class DataManager:
             # Create directory if it doesn't exist
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
+            # Serialize first so a failure never leaves a truncated file behind
+            text = json.dumps(self._data, indent=4, ensure_ascii=False)
             with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=4, ensure_ascii=False)
+                f.write(text)
             logging.info(f"Data successfully saved to {self.config_path}")
+        except RuntimeError:
+            # The data was modified by another thread while being serialized: try again later
+            logging.warning("Data changed while saving. Scheduling another save.")
+            self.request_save()
         except TypeError as e:
             logging.error(f"Type error during JSON preparation for saving: {e}")
             logging.error(f"Current data causing error: {self._data}")
         except Exception:
             logging.exception(f"Critical error saving data to {self.config_path}")
 
+    def request_save(self):
+        """
+        Marks the data as modified and schedules a save on a background thread.
+
+        Repeated requests within SAVE_DEBOUNCE_SECONDS are coalesced into one write.
+        Call flush_pending_save() before exiting to make sure nothing is lost.
+        """
+        with self._save_timer_lock:
+            self._dirty = True
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self._save_if_dirty)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_if_dirty(self):
+        """Timer callback: writes the data if there are unsaved changes."""
+        with self._save_timer_lock:
+            self._save_timer = None
+        if self._dirty:
+            self.save_data()
+
+    def flush_pending_save(self, timeout: float = 2.0):
+        """
+        Writes any unsaved changes now, cancelling the pending debounced save.
+
+        Args:
+            timeout: Maximum seconds to wait for a background save already in progress.
+        """
+        with self._save_timer_lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+        # Wait for an in-flight background write before checking the dirty flag
+        if self._save_lock.acquire(timeout=timeout):
+            self._save_lock.release()
+        else:
+            logging.warning(f"Background save still running after {timeout}s.")
+        if self._dirty:
+            self.save_data()
+
     # --- Accessor Methods ---
 
     def get_projects(self) -> Dict[str, str]:
@@ -168,7 +228,7 @@ class DataManager:
              logging.error(f"Attempted to set non-string default Godot path: {path}. Ignoring.")
              return
         self._data[DEFAULT_GODOT_PATH_KEY] = path
-        self.save_data()
+        self.request_save()
 
     def get_default_projects_folder(self) -> Optional[str]:
         """Returns the default projects folder path string."""
@@ -185,16 +245,16 @@ class DataManager:
              logging.error(f"Attempted to set invalid default projects folder: {path}. Ignoring.")
              return
         self._data[DEFAULT_PROJECTS_FOLDER_KEY] = path_str
-        self.save_data()
+        self.request_save()
 
-    def add_project(self, name: str, path_str: Union[Path, str]):
-        """Adds a project to the list and saves."""
+    def _add_project_entry(self, name: str, path_str: Union[Path, str]) -> bool:
+        """Adds a project to the in-memory data without saving. Returns True if added."""
         if not isinstance(name, str) or not name:
             logging.error(f"Attempted to add project with invalid name: {name}. Ignoring.")
-            return
+            return False
         if not isinstance(path_str, (str, Path)) or not path_str:
              logging.error(f"Attempted to add project '{name}' with invalid path: {path_str}. Ignoring.")
-             return
+             return False
 
         projects = self._data.setdefault(PROJECTS_KEY, {})
         if not isinstance(projects, dict): # Ensure it's a dict before adding
@@ -203,7 +263,27 @@ class DataManager:
              self._data[PROJECTS_KEY] = projects
 
         projects[name] = str(path_str)
-        self.save_data()
+        return True
+
+    def add_project(self, name: str, path_str: Union[Path, str]):
+        """Adds a project to the list and saves."""
+        if self._add_project_entry(name, path_str):
+            self.request_save()
+
+    def add_projects_bulk(self, projects: Iterable[Tuple[str, Union[Path, str]]]) -> int:
+        """
+        Adds several projects and saves once at the end.
+
+        Args:
+            projects: Iterable of (name, path) tuples.
+
+        Returns:
+            The number of projects added.
+        """
+        added = sum(1 for name, path_str in projects if self._add_project_entry(name, path_str))
+        if added:
+            self.request_save()
+        return added
 
     def remove_project(self, name: str) -> bool:
         """Removes a project from the list and saves. Returns True if removed."""
@@ -215,7 +295,7 @@ class DataManager:
         removed = name in projects
         if removed:
             del projects[name]
-            self.save_data()
+            self.request_save()
         return removed
 
     def add_auto_install_extension(self, asset_id: Union[int, str]) -> bool:
@@ -231,7 +311,7 @@ class DataManager:
             added = int_asset_id not in ext_list
             if added:
                 ext_list.append(int_asset_id)
-                self.save_data()
+                self.request_save()
                 logging.info(f"Extension ID {int_asset_id} successfully added to auto-install list. Current list: {ext_list}")
             else:
                 logging.info(f"Extension ID {int_asset_id} already in auto-install list. Current list: {ext_list}")
@@ -253,7 +333,7 @@ class DataManager:
             removed = int_asset_id in ext_list
             if removed:
                 ext_list.remove(int_asset_id)
-                self.save_data()
+                self.request_save()
                 logging.info(f"Extension ID {int_asset_id} successfully removed from auto-install list.")
             else:
                 logging.warning(f"Extension ID {int_asset_id} not found in auto-install list. Current IDs: {ext_list}")
@@ -320,7 +400,7 @@ class DataManager:
 
         # Save the string or None to the internal dictionary
         self._data[GODOT_VERSIONS_PATH_KEY] = path_to_save
-        self.save_data() # Save changes to JSON
+        self.request_save() # Save changes to JSON
 
     def get_all_data(self) -> Dict[str, Any]:
         """Returns a copy of all configuration data."""
@@ -53,7 +53,7 @@ from PyQt6.QtWidgets import (
 )
 
 # Import necessary functions and classes
-from api_clients import fetch_asset_details_sync
+from api_clients import fetch_asset_details_cached
 from data_manager import DataManager # Import the class, not the deprecated function
 from utils import ICON_SIZE, IconDownloader, DownloadThread, extract_zip
 from project_handler import get_godot_version_string, install_extensions_logic # Assuming install_extensions_logic is imported
@@ -314,7 +314,7 @@ class AssetDetailDialog(QDialog):
         """Fetches the complete asset details from the API."""
         # TODO: Consider making this asynchronous using a QThread to avoid blocking the UI.
         logging.info(f"Fetching full details for asset {self.asset_id}")
-        self.full_asset_data = fetch_asset_details_sync(self.asset_id)
+        self.full_asset_data = fetch_asset_details_cached(self.asset_id)
 
         if not self.full_asset_data:
             logging.error(f"Failed to retrieve details for asset {self.asset_id}")
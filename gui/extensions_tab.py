@@ -7,21 +7,22 @@ Allows searching, viewing, and configuring addons for automatic installation.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from functools import lru_cache, partial
+from typing import Any, Dict, List, NamedTuple, Optional
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, 
     QComboBox, QCheckBox, QFrame, QSizePolicy, QScrollArea, QGridLayout,
     QSpacerItem, QGroupBox, QApplication, QMainWindow, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QThread, QMetaObject, Q_ARG, QThreadPool, QTimer, QObject
-from PyQt6.QtGui import QPixmap, QIcon, QCursor, QClipboard
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QSize, QThread, QThreadPool, QTimer, QObject, QSignalBlocker
+from PyQt6.QtGui import QPixmap, QPixmapCache, QImage, QIcon, QCursor, QClipboard
 
 from data_manager import DataManager
-from api_clients import ApiFetchThread, fetch_asset_details_sync
+from api_clients import ApiFetchThread, AssetDetailsFetcher, DETAILS_FETCH_MAX_WORKERS, clear_asset_details_cache
 from project_handler import get_godot_version_string
 from gui.asset_detail_dialog import AssetDetailDialog
-from utils import IconDownloader
+from utils import IconDownloadQueue
 from gui.styles import (
     COLORS, 
     LIST_WIDGET_STYLE, 
@@ -34,16 +35,59 @@ from gui.styles import (
     # Specific styles for components
     STATUS_STYLE,
     PAGINATION_STYLE,
-    ASSET_TITLE_STYLE,
-    ASSET_INFO_STYLE,
-    COPY_BUTTON_STYLE,
-    ICON_PLACEHOLDER_STYLE,
+    ASSET_RESULTS_STYLE,
     CANCEL_BUTTON_STYLE
 )
 
 # Fixed size for icons
 ICON_SIZE = QSize(64, 64)
 
+def _icon_cache_key(asset_id: str) -> str:
+    """Returns the QPixmapCache key of the scaled icon of an extension."""
+    return f"ext_icon:{asset_id}:{ICON_SIZE.width()}x{ICON_SIZE.height()}"
+
+@lru_cache(maxsize=4096)
+def _format_modify_date(modify_timestamp: Any) -> str:
+    """Formats an asset modification date (timestamp or 'YYYY-MM-DD HH:MM:SS') as 'dd-mm-yy', or '?' if invalid."""
+    if not modify_timestamp:
+        return "?"
+    try:
+        if isinstance(modify_timestamp, (int, float)):
+            return datetime.fromtimestamp(modify_timestamp).strftime("%d-%m-%y") # Use 2-digit year for space
+        if isinstance(modify_timestamp, str):
+            # Fast path for 'YYYY-MM-DD...': just reorder the date parts
+            if len(modify_timestamp) >= 10 and modify_timestamp[4] == "-" and modify_timestamp[7] == "-":
+                return f"{modify_timestamp[8:10]}-{modify_timestamp[5:7]}-{modify_timestamp[2:4]}"
+            return datetime.strptime(modify_timestamp, "%Y-%m-%d %H:%M:%S").strftime("%d-%m-%y")
+    except (ValueError, TypeError, OSError):
+        pass
+    return "?"
+
+class AssetView(NamedTuple):
+    """Fields of an API asset dictionary read when binding a result row, extracted once per page."""
+    asset_id: Any
+    title: str
+    author: str
+    version_string: str
+    godot_version: str
+    cost: str
+    category: str
+    rating: Any
+    modify_date: Any
+    support_level: str
+    icon_url: str
+    raw: dict # Original dictionary, passed to the detail dialog
+
+    @classmethod
+    def from_asset(cls, asset: dict) -> "AssetView":
+        """Creates an AssetView from an API asset dictionary, applying the display defaults."""
+        get = asset.get
+        return cls(
+            get("asset_id"), get("title", "Untitled"), get("author", "N/A"), get("version_string", "?"),
+            get("godot_version", "?"), get("cost", "?"), get("category", "N/A"), get("rating", "0"),
+            get("modify_date", ""), get("support_level", "?"), get("icon_url", ""), asset,
+        )
+
 # Custom class for clickable frames
 class ClickableAssetFrame(QFrame):
     """Clickable frame to represent an asset of the Godot Asset Library."""
@@ -62,6 +106,8 @@ class ExtensionsTab(QWidget):
     # Signal emitted when the selection of extensions for auto-install changes
     auto_install_selection_changed = pyqtSignal()
     status_message = pyqtSignal(str, int) # Emitted to show messages in the main window status bar (message, timeout_ms)
+    # Signal emitted when the AssetDetailDialog is shown, passing the dialog instance (same as TemplatesTab)
+    asset_detail_dialog_shown = pyqtSignal(AssetDetailDialog)
 
     def __init__(self, data_manager: DataManager):
         """
@@ -72,18 +118,45 @@ class ExtensionsTab(QWidget):
         """
         super().__init__()
         self.data_manager = data_manager # Store DataManager instance
+        # Bound DataManager accessors used when rendering and toggling results (saves an attribute lookup per call)
+        self._get_auto_install_extensions = data_manager.get_auto_install_extensions
+        self._get_godot_path = data_manager.get_godot_path
         self.asset_widgets: Dict[str, Dict[str, QWidget]] = {} # Stores asset widgets {asset_id: {'widget': ClickableAssetFrame, 'checkbox': QCheckBox}}
         self.icon_labels: Dict[str, QLabel] = {} # Stores icon labels by asset ID
+        self._frame_pool: List[ClickableAssetFrame] = [] # All asset frames built so far, in layout order (reused)
         self.thread_pool = QThreadPool() # Thread pool for icon downloads
         self.thread_pool.setMaxThreadCount(4) # Limit concurrent icon downloads
+        self.icon_queue = IconDownloadQueue(self.thread_pool, max_workers=4, scale_to=ICON_SIZE) # Decoded and scaled in the workers
+        self.icon_queue.signals.image_ready.connect(self.on_icon_ready)
+        self.icon_queue.signals.error.connect(self.on_icon_error)
         self.api_thread: Optional[ApiFetchThread] = None # Holds the current API search thread
+        self.details_pool = QThreadPool() # Thread pool for 'Selected Only' detail requests
+        self.details_pool.setMaxThreadCount(DETAILS_FETCH_MAX_WORKERS)
+        self._details_batch_id: int = 0 # Incremented for each 'Selected Only' fetch; stale results are ignored
+        self._pending_details: set = set() # Asset IDs still being fetched in the current batch
+        self._collected_details: Dict[str, dict] = {} # Fetched details of the current batch by asset ID
+        self._details_errors: List[str] = [] # Errors of the current batch
+        self._details_order: List[str] = [] # Selected IDs in display order
         self.current_page: int = 0 # Current page number (0-based) for API results
         self.total_pages: int = 0 # Total pages available from the last API search
         self.total_items: int = 0 # Total items available from the last API search
         self.client_side_sort: Optional[str] = None # Flag for client-side sorting (e.g., 'selected')
+        self._last_display_sig: Optional[int] = None # Hash of the asset IDs currently displayed
+        self._last_selected_sig: Optional[int] = None # Hash of the selected IDs when the results were drawn
+
+        # Reusable timers for delayed UI resets (instead of one closure per click)
+        self._pending_status_msg: Optional[str] = None # Status message to clear when _status_reset_timer fires
+        self._status_reset_timer = QTimer(self)
+        self._status_reset_timer.setSingleShot(True)
+        self._status_reset_timer.timeout.connect(self._reset_status_label)
+        self._pending_copy_btn: Optional[QPushButton] = None # Copy button showing the 'copied' feedback
+        self._pending_copy_text: str = "" # Original text of that button
+        self._button_restore_timer = QTimer(self)
+        self._button_restore_timer.setSingleShot(True)
+        self._button_restore_timer.timeout.connect(self._restore_copy_button)
         
         # Log of selected extensions at startup
-        selected_extensions = self.data_manager.get_auto_install_extensions()
+        selected_extensions = self._get_auto_install_extensions()
         logging.info(f"ExtensionsTab initialized. Selected extensions: {selected_extensions}")
         
         self.init_ui()
@@ -163,6 +236,12 @@ class ExtensionsTab(QWidget):
         self.search_button = QPushButton("🔍 Search Extensions")
         self.search_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
         filter_layout.addWidget(self.search_button)
+
+        # Explicit refresh: re-runs the current view, re-fetching selected extension details
+        self.refresh_button = QPushButton("⟳ Refresh")
+        self.refresh_button.setStyleSheet(BUTTON_STYLE)
+        self.refresh_button.setToolTip("Repeat the current search. In 'Selected Only' view, cached extension details are fetched again.")
+        filter_layout.addWidget(self.refresh_button)
         layout.addWidget(filter_group)
 
         # --- Results Scroll Area ---
@@ -178,11 +257,18 @@ class ExtensionsTab(QWidget):
         """)
         
         self.results_widget = QWidget() # Container for results
-        self.results_widget.setStyleSheet(f"background-color: {COLORS['bg_dark']};")
+        self.results_widget.setStyleSheet(ASSET_RESULTS_STYLE) # Parsed once for all asset rows
         
         self.results_layout = QVBoxLayout(self.results_widget) # Layout for asset items
         self.results_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.results_layout.setSpacing(5) # Reduced spacing for denser list
+
+        # Persistent container for the asset rows; its frames are reused across searches
+        self.rows_widget = QWidget()
+        self.rows_layout = QVBoxLayout(self.rows_widget)
+        self.rows_layout.setContentsMargins(0, 0, 0, 0)
+        self.rows_layout.setSpacing(self.results_layout.spacing())
+        self.results_layout.addWidget(self.rows_widget)
         self.scroll_area.setWidget(self.results_widget)
         layout.addWidget(self.scroll_area, 1) # Scroll area takes available vertical space
 
@@ -229,6 +315,7 @@ class ExtensionsTab(QWidget):
 
         # --- Connect Signals ---
         self.search_button.clicked.connect(lambda: self.search_assets(page=0)) # Search starts from page 0
+        self.refresh_button.clicked.connect(self.refresh_search_results)
         self.search_edit.returnPressed.connect(lambda: self.search_assets(page=0))
         self.cancel_search_button.clicked.connect(self.cancel_search)
         self.prev_page_btn.clicked.connect(self.go_to_previous_page)
@@ -255,6 +342,10 @@ class ExtensionsTab(QWidget):
         # --- END MODIFICATION ---
 
         # If checkbox is NOT active, proceed with normal API search...
+        if self._pending_details:
+            self._details_batch_id += 1 # Results of the 'Selected Only' fetch are no longer needed
+            self._pending_details = set()
+
         if self.api_thread and self.api_thread.isRunning():
             logging.warning("API search request ignored: Another search is already running.")
             return # Prevent concurrent searches
@@ -262,11 +353,11 @@ class ExtensionsTab(QWidget):
         self.current_page = page # Set current page
 
         # Get Godot version filter
-        current_godot_path = self.data_manager.get_godot_path()
+        current_godot_path = self._get_godot_path()
         godot_version_filter = get_godot_version_string(current_godot_path)
 
         logging.info(f"Starting extension search - Page: {self.current_page}, Godot Version Filter: {godot_version_filter}")
-        self._clear_results() # Clear previous results
+        # Previous results stay visible until the new ones arrive (see _display_assets)
 
         # Get search parameters from UI
         query = self.search_edit.text().strip()
@@ -353,6 +444,8 @@ class ExtensionsTab(QWidget):
         logging.info("ExtensionsTab: Received refresh_search_results command.")
         # --- MODIFIED: Selected Filter Handling --- 
         if self.show_selected_only_cb.isChecked():
+            # Only this view reads cached asset details: drop them so the refresh is real
+            clear_asset_details_cache()
             # If showing only selected, just call the dedicated function
             self._fetch_and_display_selected()
         # --- END MODIFICATION ---
@@ -479,19 +572,26 @@ class ExtensionsTab(QWidget):
             logging.warning("Attempted to go to next page from the last page.")
 
     def _clear_results(self):
-        """Removes all asset widgets from the results layout."""
+        """Hides the pooled asset frames and removes any other widget (e.g., placeholders) from the results layout."""
+        self._last_display_sig = None
+        self._last_selected_sig = None
         self.asset_widgets.clear()
         self.icon_labels.clear()
-        while self.results_layout.count():
-            child_item = self.results_layout.takeAt(0)
-            if child_item:
-                widget = child_item.widget()
-                if widget:
-                    logging.debug(f"Removing result widget: {widget.objectName() if widget.objectName() else type(widget)}")
-                    widget.deleteLater()
+        self.icon_queue.clear() # Icons of the previous results are no longer needed
+        if self._button_restore_timer.isActive():
+            self._restore_copy_button() # The button is about to be rebound
+        for frame in self._frame_pool:
+            frame.hide()
+        for i in reversed(range(self.results_layout.count())):
+            widget = self.results_layout.itemAt(i).widget()
+            if widget is not None and widget is not self.rows_widget:
+                self.results_layout.takeAt(i)
+                logging.debug(f"Removing result widget: {widget.objectName() if widget.objectName() else type(widget)}")
+                widget.deleteLater()
 
     def _add_placeholder_label(self, message: str):
-        """Adds a centered placeholder message to the results area."""
+        """Replaces the results area content with a centered placeholder message."""
+        self._clear_results()
         placeholder = QLabel(message)
         placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
         placeholder.setWordWrap(True)
@@ -516,7 +616,20 @@ class ExtensionsTab(QWidget):
             return
 
         # Get the list of currently selected auto-install extensions
-        selected_ids_set = set(self.data_manager.get_auto_install_extensions())
+        selected_ids_set = set(self._get_auto_install_extensions())
+
+        views = [AssetView.from_asset(asset) for asset in assets] # One pass of dict lookups per page
+
+        # Skip the rebuild if the same assets are already displayed with the same selection
+        display_sig = hash(tuple(view.asset_id for view in views))
+        selected_sig = hash(frozenset(selected_ids_set))
+        if self.asset_widgets and display_sig == self._last_display_sig and selected_sig == self._last_selected_sig:
+            logging.debug("Results unchanged since last display. Skipping rebuild.")
+            return
+
+        self._clear_results() # Clear previous results
+        self._last_display_sig = display_sig
+        self._last_selected_sig = selected_sig
         logging.debug(f"Displaying {len(assets)} asset results. Selected IDs: {selected_ids_set}")
 
         # Handle case where we have a result but no items - shouldn't happen, but...
@@ -526,165 +639,162 @@ class ExtensionsTab(QWidget):
             self.status_label.setText("No results found.")
             return
         
-        # Style for asset titles
-        asset_title_style = f"""
-            QLabel {{
-                color: {COLORS["text_primary"]};
-                font-weight: bold;
-                font-size: 13px;
-            }}
-        """
-        
-        # Style for asset info
-        asset_info_style = f"""
-            QLabel {{
-                color: {COLORS["text_secondary"]};
-                font-size: 11px;
-            }}
+        # Rebind pooled frames in order; build new ones only when the page has more assets than the pool.
+        # Disabling updates on the container also suppresses repaints of every frame while it is filled
+        # (frames are hidden until bound), so no per-frame setUpdatesEnabled is needed.
+        self.results_widget.setUpdatesEnabled(False)
+        frame_index = 0
+        for view in views:
+            try:
+                if frame_index < len(self._frame_pool):
+                    asset_frame = self._frame_pool[frame_index]
+                else:
+                    asset_frame = self._build_asset_frame()
+                    self._frame_pool.append(asset_frame)
+                    self.rows_layout.addWidget(asset_frame)
+                if self._bind_asset_frame(asset_frame, view, selected_ids_set):
+                    asset_frame.show()
+                    frame_index += 1
+
+            except Exception as e:
+                logging.exception(f"Error displaying extension asset ID {view.asset_id}")
+
+        self.results_widget.setUpdatesEnabled(True)
+        logging.debug(f"Finished displaying extension assets ({len(self._frame_pool)} pooled frames).")
+
+    def _build_asset_frame(self) -> ClickableAssetFrame:
         """
-        
-        # Style for ID copy buttons
-        copy_button_style = f"""
-            QPushButton {{
-                background-color: {COLORS["bg_content"]};
-                color: {COLORS["text_primary"]};
-                border: 1px solid {COLORS["border"]};
-                border-radius: 4px;
-                padding: 4px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                border-color: {COLORS["accent"]};
-                color: white;
-            }}
-            QPushButton:pressed {{
-                background-color: {COLORS["accent_hover"]};
-            }}
+        Builds an empty, hidden asset row. Signals are connected once here; the row is
+        filled (and refilled on later searches) by _bind_asset_frame.
+
+        Returns:
+            The new asset frame, with references to its child widgets stored as attributes.
         """
-        
-        # Style for unloaded icons
-        icon_placeholder_style = f"""
-            QLabel {{
-                background-color: {COLORS["bg_dark"]};
-                border: 1px solid {COLORS["border"]};
-                border-radius: 4px;
-                color: {COLORS["text_secondary"]};
-                padding: 2px;
-                qproperty-alignment: AlignCenter;
-            }}
+        # Create a clickable frame for the entire asset
+        asset_frame = ClickableAssetFrame()
+        asset_frame.setFrameShape(QFrame.Shape.StyledPanel)
+        asset_frame.setMinimumHeight(120) # Ensure reasonable height
+        asset_frame.setCursor(Qt.CursorShape.PointingHandCursor)
+        asset_frame.clicked.connect(self._on_asset_frame_clicked)
+        asset_frame.hide()
+
+        # Create layout for the asset
+        item_layout = QHBoxLayout(asset_frame)
+        item_layout.setContentsMargins(5, 5, 5, 5)
+        item_layout.setSpacing(10) # Spacing between elements
+
+        # Icon Label (placeholder until icon is downloaded)
+        asset_frame.icon_label = QLabel()
+        asset_frame.icon_label.setFixedSize(ICON_SIZE)
+        asset_frame.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        item_layout.addWidget(asset_frame.icon_label)
+
+        # Auto-Install Checkbox
+        asset_frame.checkbox = QCheckBox()
+        asset_frame.checkbox.setToolTip("Select to include in multi-installation\n(and auto-installation for new projects)")
+        asset_frame.checkbox.checkStateChanged.connect(self.toggle_auto_install) # Connect state change (delivers the enum)
+        item_layout.addWidget(asset_frame.checkbox)
+
+        # Text Info Layout
+        info_layout = QVBoxLayout()
+        info_layout.setSpacing(2) # Compact spacing
+        asset_frame.title_label = QLabel()
+        asset_frame.title_label.setWordWrap(True)
+        asset_frame.title_label.setProperty("class", "assetTitle")
+        info_layout.addWidget(asset_frame.title_label)
+        asset_frame.author_label = QLabel()
+        asset_frame.version_label = QLabel()
+        asset_frame.category_label = QLabel()
+        asset_frame.date_label = QLabel()
+        for info_label in (asset_frame.author_label, asset_frame.version_label, asset_frame.category_label, asset_frame.date_label):
+            info_label.setProperty("class", "assetInfo")
+            info_layout.addWidget(info_label)
+        item_layout.addLayout(info_layout, 1) # Info takes remaining space
+
+        # Copy ID Button Layout
+        button_layout = QVBoxLayout()
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        asset_frame.copy_button = QPushButton("📋 ID")
+        asset_frame.copy_button.setToolTip("Copy asset ID to clipboard")
+        asset_frame.copy_button.setFixedWidth(60) # Make button smaller
+        asset_frame.copy_button.setProperty("class", "copyIdBtn")
+        # Connect button click directly, preventing propagation to frame
+        asset_frame.copy_button.clicked.connect(partial(self.copy_asset_id_for, asset_frame.copy_button))
+        button_layout.addWidget(asset_frame.copy_button)
+        item_layout.addLayout(button_layout)
+
+        return asset_frame
+
+    def _bind_asset_frame(self, asset_frame: ClickableAssetFrame, view: AssetView, selected_ids_set: set) -> bool:
         """
+        Fills a pooled asset row with the data of an asset and registers its icon label and checkbox.
 
-        for asset in assets:
-            try:
-                asset_id = asset.get("asset_id")
-                if asset_id is None:
-                    logging.warning("Asset without an ID found in results. Skipping.")
-                    continue
-
-                title = asset.get("title", "Untitled")
-                icon_url = asset.get("icon_url", "")
-
-                # Create a clickable frame for the entire asset
-                asset_frame = ClickableAssetFrame()
-                asset_frame.setFrameShape(QFrame.Shape.StyledPanel)
-                asset_frame.setMinimumHeight(120) # Ensure reasonable height
-                asset_frame.setCursor(Qt.CursorShape.PointingHandCursor)
-                asset_frame.clicked.connect(lambda asset_data=asset: self._show_asset_details(asset_data))
-
-                # Create layout for the asset
-                item_layout = QHBoxLayout(asset_frame)
-                item_layout.setContentsMargins(5, 5, 5, 5)
-                item_layout.setSpacing(10) # Spacing between elements
-
-                # Icon Label (placeholder until icon is downloaded)
-                icon_label = QLabel()
-                icon_label.setFixedSize(ICON_SIZE)
-                icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                icon_label.setStyleSheet(ICON_PLACEHOLDER_STYLE)
-                icon_label.setText("...") # Placeholder
-                item_layout.addWidget(icon_label)
-                self.icon_labels[str(asset_id)] = icon_label # Store reference
-                if icon_url: self.start_icon_download(asset_id, icon_url)
-                else: icon_label.setText("N/A")
-
-                # Auto-Install Checkbox - Ensure its state is correctly set based on the ID
-                checkbox = QCheckBox()
-                # Converti l'ID in int per il confronto con l'insieme di ID selezionati
-                int_asset_id = int(asset_id) if isinstance(asset_id, (int, str)) else asset_id
-                is_selected = int_asset_id in selected_ids_set
-                logging.debug(f"Asset ID {asset_id} (type: {type(asset_id)}) selected: {is_selected}")
-                
-                # Block signals during initial setup to avoid unwanted activations
-                checkbox.blockSignals(True)
-                checkbox.setChecked(is_selected)
-                checkbox.blockSignals(False)
-                
-                checkbox.setToolTip("Select to include in multi-installation\n(and auto-installation for new projects)")
-                checkbox.setProperty("asset_id", asset_id) # Store ID on checkbox
-                checkbox.stateChanged.connect(self.toggle_auto_install) # Connect state change
-                checkbox.setStyleSheet(CHECKBOX_STYLE)
-                item_layout.addWidget(checkbox)
-
-                # Text Info Layout
-                info_layout = QVBoxLayout()
-                info_layout.setSpacing(2) # Compact spacing
-                title_label = QLabel(f"<b>{title}</b>")
-                title_label.setWordWrap(True)
-                title_label.setStyleSheet(ASSET_TITLE_STYLE)
-                info_layout.addWidget(title_label)
-                
-                author_label = QLabel(f"<small>by {asset.get('author','N/A')} (ID:{asset_id})</small>")
-                author_label.setStyleSheet(ASSET_INFO_STYLE)
-                info_layout.addWidget(author_label)
-                
-                version_label = QLabel(f"<small>v{asset.get('version_string','?')} ({asset.get('godot_version','?')}) Lic:{asset.get('cost','?')}</small>")
-                version_label.setStyleSheet(ASSET_INFO_STYLE)
-                info_layout.addWidget(version_label)
-                
-                category_label = QLabel(f"<small>Cat:{asset.get('category','N/A')} Val:{asset.get('rating','0')}/5⭐</small>")
-                category_label.setStyleSheet(ASSET_INFO_STYLE)
-                info_layout.addWidget(category_label)
-
-                # Format modification date (similar to TemplatesTab)
-                modify_date_str = "?"
-                try:
-                    modify_timestamp = asset.get("modify_date", "")
-                    if modify_timestamp:
-                         if isinstance(modify_timestamp, (int, float)):
-                              mod_dt = datetime.fromtimestamp(modify_timestamp)
-                              modify_date_str = mod_dt.strftime("%d-%m-%y") # Use 2-digit year for space
-                         elif isinstance(modify_timestamp, str):
-                              mod_dt = datetime.strptime(modify_timestamp, "%Y-%m-%d %H:%M:%S")
-                              modify_date_str = mod_dt.strftime("%d-%m-%y")
-                except (ValueError, TypeError, OSError): modify_date_str = "?"
-
-                date_label = QLabel(f"<small>Mod:{modify_date_str} Sup:{asset.get('support_level','?')}</small>")
-                date_label.setStyleSheet(ASSET_INFO_STYLE)
-                info_layout.addWidget(date_label)
-                item_layout.addLayout(info_layout, 1) # Info takes remaining space
-
-                # Copy ID Button Layout
-                button_layout = QVBoxLayout()
-                button_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                copy_button = QPushButton("📋 ID")
-                copy_button.setToolTip("Copy asset ID to clipboard")
-                copy_button.setProperty("asset_id", asset_id)
-                copy_button.setFixedWidth(60) # Make button smaller
-                copy_button.setStyleSheet(COPY_BUTTON_STYLE)
-                # Connect button click directly, preventing propagation to frame
-                copy_button.clicked.connect(lambda checked=False, btn=copy_button: self.copy_asset_id_from_button(btn))
-                button_layout.addWidget(copy_button)
-                item_layout.addLayout(button_layout)
-
-                # Add the complete asset frame to the results layout
-                self.results_layout.addWidget(asset_frame)
-                # Store references to the frame and checkbox for potential future use
-                self.asset_widgets[str(asset_id)] = {"widget": asset_frame, "checkbox": checkbox}
-
-            except Exception as e:
-                logging.exception(f"Error displaying extension asset ID {asset.get('asset_id', 'N/A')}")
+        Args:
+            asset_frame: A frame created by _build_asset_frame.
+            view: The asset fields, extracted from the API dictionary.
+            selected_ids_set: IDs currently selected for auto-installation.
 
-        logging.debug("Finished displaying extension assets.")
+        Returns:
+            True if the frame was bound, False if the asset has no ID.
+        """
+        asset_id = view.asset_id
+        if asset_id is None:
+            logging.warning("Asset without an ID found in results. Skipping.")
+            return False
+
+        icon_url = view.icon_url
+        asset_frame.setProperty("asset_data", view.raw) # Read back by _on_asset_frame_clicked
+
+        # Icon: reset to placeholder, then load (from cache or download)
+        icon_label = asset_frame.icon_label
+        icon_label.clear()
+        icon_label.setToolTip("")
+        self._set_label_class(icon_label, "iconPlaceholder") # Also drops the error style of a previous binding
+        icon_label.setText("...") # Placeholder
+        self.icon_labels[str(asset_id)] = icon_label # Store reference
+        if icon_url: self.start_icon_download(asset_id, icon_url)
+        else: icon_label.setText("N/A")
+
+        # Auto-Install Checkbox - Ensure its state is correctly set based on the ID
+        checkbox = asset_frame.checkbox
+        # Converti l'ID in int per il confronto con l'insieme di ID selezionati
+        int_asset_id = int(asset_id) if isinstance(asset_id, (int, str)) else asset_id
+        is_selected = int_asset_id in selected_ids_set
+        logging.debug(f"Asset ID {asset_id} (type: {type(asset_id)}) selected: {is_selected}")
+
+        # Block signals during setup to avoid unwanted activations
+        with QSignalBlocker(checkbox):
+            checkbox.setChecked(is_selected)
+        checkbox.setProperty("asset_id", asset_id) # Store ID on checkbox
+
+        # Text info
+        asset_frame.title_label.setText(f"<b>{view.title}</b>")
+        asset_frame.author_label.setText(f"<small>by {view.author} (ID:{asset_id})</small>")
+        asset_frame.version_label.setText(f"<small>v{view.version_string} ({view.godot_version}) Lic:{view.cost}</small>")
+        asset_frame.category_label.setText(f"<small>Cat:{view.category} Val:{view.rating}/5⭐</small>")
+
+        # Format modification date (similar to TemplatesTab)
+        modify_date_str = _format_modify_date(view.modify_date)
+        asset_frame.date_label.setText(f"<small>Mod:{modify_date_str} Sup:{view.support_level}</small>")
+
+        # Copy ID Button
+        asset_frame.copy_button.setProperty("asset_id", asset_id)
+
+        # Store references to the frame and checkbox for potential future use
+        self.asset_widgets[str(asset_id)] = {"widget": asset_frame, "checkbox": checkbox}
+        return True
+
+    @pyqtSlot()
+    def _on_asset_frame_clicked(self):
+        """Shared slot for all asset frames; reads the asset data stored on the sender."""
+        frame = self.sender()
+        if not isinstance(frame, ClickableAssetFrame): return
+
+        asset_data = frame.property("asset_data")
+        if asset_data is None:
+            logging.warning("Asset frame clicked, but asset_data property not found.")
+            return
+        self._show_asset_details(asset_data)
 
     def _show_asset_details(self, asset_data: dict):
         """Opens the AssetDetailDialog when a ClickableAssetFrame is clicked."""
@@ -706,58 +816,47 @@ class ExtensionsTab(QWidget):
 
         dialog = AssetDetailDialog(asset_id, initial_data, self.data_manager, dialog_parent)
 
-        # Connect the dialog's install request signal to the main window's handler
-        # This allows the main window to coordinate installation with the ProjectsTab
-        if isinstance(main_window, QMainWindow) and hasattr(main_window, "handle_install_extension_request"):
-            try:
-                dialog.install_extension_requested.connect(main_window.handle_install_extension_request)
-                logging.debug("Connected install_extension_requested signal to MainWindow handler.")
-            except TypeError as e: # Catch potential connection errors
-                logging.exception("Error connecting install_extension_requested signal")
-        elif isinstance(main_window, QMainWindow):
-            logging.error("Could not connect install signal: MainWindow found but missing 'handle_install_extension_request' slot!")
-        else:
-            logging.error("Could not connect install signal: MainWindow instance not found.")
+        # Let MainWindow connect its slots (install request) and remember the title already shown here
+        self.asset_detail_dialog_shown.emit(dialog)
 
         dialog.exec() # Show the dialog modally
 
-    def copy_asset_id_from_button(self, button: QPushButton):
-        """Wrapper to call copy_asset_id, ensuring the button is treated as the sender."""
-        logging.debug("Copy ID button clicked.")
-        original_sender_func = self.sender
-        self.sender = lambda: button # Temporarily set sender
-        try:
-            self.copy_asset_id()
-        finally:
-            self.sender = original_sender_func # Restore sender
-
     def start_icon_download(self, asset_id: Any, icon_url: str):
         """Starts an asynchronous download task for an asset icon."""
-        downloader = IconDownloader(str(asset_id), icon_url)
-        downloader.signals.icon_ready.connect(self.on_icon_ready)
-        downloader.signals.error.connect(self.on_icon_error)
-        self.thread_pool.start(downloader)
+        scaled_pixmap = QPixmapCache.find(_icon_cache_key(str(asset_id)))
+        if scaled_pixmap is not None and not scaled_pixmap.isNull() and str(asset_id) in self.icon_labels:
+            # Icon already decoded and scaled during a previous search
+            self._set_icon_pixmap(self.icon_labels[str(asset_id)], scaled_pixmap)
+            return
+        self.icon_queue.enqueue(asset_id, icon_url)
 
-    def on_icon_ready(self, asset_id: str, local_path: str):
-        """Slot called when an icon is downloaded or retrieved from cache."""
+    def on_icon_ready(self, asset_id: str, image: QImage):
+        """Slot called when an icon has been downloaded (or read from disk) and scaled by the worker."""
         # Check if the label still exists (results might have been cleared)
         if asset_id in self.icon_labels:
             label = self.icon_labels[asset_id]
-            pixmap = QPixmap(local_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(
-                    ICON_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
-                )
-                label.setPixmap(scaled_pixmap)
-                label.setStyleSheet("") # Clear placeholder style
-                label.setText("")
+            scaled_pixmap = QPixmap.fromImage(image) # Only the conversion runs on the GUI thread
+            if not scaled_pixmap.isNull():
+                QPixmapCache.insert(_icon_cache_key(asset_id), scaled_pixmap) # Reused by start_icon_download
+                self._set_icon_pixmap(label, scaled_pixmap)
             else:
-                logging.warning(f"Could not load QPixmap for icon {asset_id} from {local_path}")
+                logging.warning(f"Could not convert icon image for asset {asset_id}")
                 label.setText("Err")
-                label.setStyleSheet("background-color:#fdd; border:1px solid red; color: red; qproperty-alignment: AlignCenter;")
+                self._set_label_class(label, "iconError")
         else:
             logging.debug(f"Icon ready for asset {asset_id}, but label no longer exists.")
 
+    def _set_icon_pixmap(self, label: QLabel, pixmap: QPixmap):
+        """Shows an already scaled icon in its label, replacing the placeholder."""
+        label.setPixmap(pixmap)
+        self._set_label_class(label, "") # Drop placeholder style
+
+    def _set_label_class(self, label: QLabel, style_class: str):
+        """Sets the 'class' property used by ASSET_RESULTS_STYLE, re-polishing only if it changed."""
+        if (label.property("class") or "") != style_class:
+            label.setProperty("class", style_class)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     def on_icon_error(self, asset_id: str, error_message: str):
         """Slot called when an icon download fails."""
@@ -765,17 +864,12 @@ class ExtensionsTab(QWidget):
             label = self.icon_labels[asset_id]
             label.setText("Fail")
             label.setToolTip(f"Unable to download icon:\n{error_message}")
-            label.setStyleSheet(f"""
-                background-color: {COLORS["bg_dark"]};
-                border: 1px solid {COLORS["error"]};
-                color: {COLORS["error"]};
-                border-radius: 4px;
-                qproperty-alignment: AlignCenter;
-            """)
+            self._set_label_class(label, "iconError")
         else:
              logging.debug(f"Icon error for asset {asset_id}, but label no longer exists.")
 
-    def toggle_auto_install(self, state: int):
+    @pyqtSlot(Qt.CheckState)
+    def toggle_auto_install(self, state: Qt.CheckState):
         """Handles the state change of an auto-install checkbox."""
         checkbox = self.sender()
         if not isinstance(checkbox, QCheckBox): return
@@ -785,7 +879,7 @@ class ExtensionsTab(QWidget):
 
         success = False
         action_str = ""
-        is_checked = (state == Qt.CheckState.Checked.value)
+        is_checked = (state == Qt.CheckState.Checked)
 
         try:
             if is_checked:
@@ -802,15 +896,20 @@ class ExtensionsTab(QWidget):
                 status_msg = f"Extension ID {asset_id} {action_str} auto-install list."
                 logging.info(status_msg)
                 self.status_label.setText(status_msg)
+                # In the 'Selected Only' view, just hide the row that is no longer selected
+                if not is_checked and self.show_selected_only_cb.isChecked():
+                    row_widgets = self.asset_widgets.get(str(asset_id))
+                    if row_widgets:
+                        row_widgets["widget"].setVisible(False)
                 # Clear status message after a delay
-                QTimer.singleShot(3000, lambda: self.status_label.setText("Ready.") if self.status_label.text() == status_msg else None)
+                self._pending_status_msg = status_msg
+                self._status_reset_timer.start(3000)
             else:
                 # Should not happen if DataManager logic is correct, but handle defensively
                 logging.warning(f"Failed to {action_str} auto-install list for ID {asset_id}.")
                 # Revert checkbox state visually if operation failed
-                checkbox.blockSignals(True)
-                checkbox.setChecked(not is_checked)
-                checkbox.blockSignals(False)
+                with QSignalBlocker(checkbox):
+                    checkbox.setChecked(not is_checked)
                 
                 # Show detailed message to user
                 if is_checked:
@@ -821,17 +920,20 @@ class ExtensionsTab(QWidget):
         except Exception as e:
              logging.exception(f"Error toggling auto-install for asset ID {asset_id}")
              # Revert checkbox state visually on error
-             checkbox.blockSignals(True)
-             checkbox.setChecked(not is_checked)
-             checkbox.blockSignals(False)
+             with QSignalBlocker(checkbox):
+                 checkbox.setChecked(not is_checked)
              QMessageBox.critical(self, "Error", f"An unexpected error occurred while updating auto-install list:\n{e}")
 
 
+    @pyqtSlot()
     def copy_asset_id(self):
         """Copies the asset ID from the sender button's property to the clipboard."""
         button = self.sender()
-        if not isinstance(button, QPushButton): return
+        if isinstance(button, QPushButton):
+            self.copy_asset_id_for(button)
 
+    def copy_asset_id_for(self, button: QPushButton, checked: bool = False):
+        """Copies the asset ID stored in the given button's property to the clipboard."""
         asset_id = button.property("asset_id")
         if asset_id is not None:
             try:
@@ -839,11 +941,14 @@ class ExtensionsTab(QWidget):
                 clipboard.setText(str(asset_id))
                 self.status_label.setText(f"Asset ID {asset_id} copied to clipboard.")
                 # Provide visual feedback on the button
-                original_text = button.text()
+                if self._button_restore_timer.isActive():
+                    self._restore_copy_button() # Another button is still showing feedback: restore it now
+                self._pending_copy_btn = button
+                self._pending_copy_text = button.text()
                 button.setText("✅")
                 button.setEnabled(False)
                 # Restore button after a short delay
-                QTimer.singleShot(1500, lambda: (button.setText(original_text), button.setEnabled(True)) if button else None)
+                self._button_restore_timer.start(1500)
             except Exception as e:
                 logging.exception(f"Failed to copy asset ID {asset_id} to clipboard.")
                 self.status_label.setText(f"<font color='red'>Error copying ID: {e}</font>")
@@ -851,6 +956,24 @@ class ExtensionsTab(QWidget):
             logging.warning("Copy ID button clicked, but asset_id property not found.")
             self.status_label.setText("<font color='red'>Could not find Asset ID.</font>")
 
+    def _reset_status_label(self):
+        """Resets the status label, unless another message has replaced the pending one."""
+        if self.status_label.text() == self._pending_status_msg:
+            self.status_label.setText("Ready.")
+        self._pending_status_msg = None
+
+    def _restore_copy_button(self):
+        """Restores the copy button that is showing the 'copied' feedback."""
+        button = self._pending_copy_btn
+        self._pending_copy_btn = None
+        if button is None:
+            return
+        try:
+            button.setText(self._pending_copy_text)
+            button.setEnabled(True)
+        except RuntimeError: # Button deleted meanwhile (results cleared)
+            logging.debug("Copy button deleted before its text could be restored.")
+
     def cancel_search(self):
         """Cancels the current API search operation."""
         logging.info("Cancelling extension search...")
@@ -870,7 +993,6 @@ class ExtensionsTab(QWidget):
             # QTimer.singleShot(100, self._fetch_and_display_selected) # Retry after a delay?
             # return
 
-        self._clear_results() # Clear the results area
         self.pagination_widget.setVisible(False) # Hide pagination
         # Temporarily disable search/filter controls
         self.search_button.setEnabled(False)
@@ -880,7 +1002,7 @@ class ExtensionsTab(QWidget):
         self.support_official_cb.setEnabled(False)
         self.support_testing_cb.setEnabled(False)
 
-        selected_ids = self.data_manager.get_auto_install_extensions()
+        selected_ids = self._get_auto_install_extensions()
 
         if not selected_ids:
             self.status_label.setText("No extensions selected for auto-installation.")
@@ -894,28 +1016,44 @@ class ExtensionsTab(QWidget):
             self.support_testing_cb.setEnabled(True)
             return
 
+        # Start a new batch; results of any previous one will be ignored
+        self._details_batch_id += 1
+        self._details_order = [str(asset_id) for asset_id in selected_ids]
+        self._pending_details = set(self._details_order)
+        self._collected_details = {}
+        self._details_errors = []
+
         self.status_label.setText(f"Loading details for {len(selected_ids)} selected extensions...")
-        QApplication.processEvents() # Update UI
-
-        detailed_assets = []
-        errors = []
-        # TODO: Consider a QThread if there are many selected extensions to avoid blocking the UI
-        for i, asset_id in enumerate(selected_ids):
-            self.status_label.setText(f"Loading {i+1}/{len(selected_ids)}: ID {asset_id}...")
-            QApplication.processEvents()
-            try:
-                details = fetch_asset_details_sync(asset_id)
-                if details:
-                    # Ensure the type is correct for AssetDetailDialog
-                    details.setdefault("type", "addon")
-                    detailed_assets.append(details)
-                else:
-                    logging.warning(f"Unable to retrieve details for selected extension ID: {asset_id}")
-                    errors.append(f"ID {asset_id}: Details not found")
-            except Exception as e:
-                logging.exception(f"Error retrieving details for selected extension ID: {asset_id}")
-                errors.append(f"ID {asset_id}: API Error ({e})")
+        for asset_id in dict.fromkeys(self._details_order): # Request order, without duplicates
+            fetcher = AssetDetailsFetcher(self._details_batch_id, asset_id)
+            fetcher.signals.finished.connect(self._on_detail_ready)
+            self.details_pool.start(fetcher)
+
+    def _on_detail_ready(self, batch_id: int, asset_id: str, details: Optional[dict], error_message: str):
+        """Slot called when the details of one selected extension have been fetched."""
+        if batch_id != self._details_batch_id or asset_id not in self._pending_details:
+            logging.debug(f"ExtensionsTab: Ignored details for asset {asset_id} from an old batch.")
+            return
+        self._pending_details.discard(asset_id)
+
+        if details:
+            # Ensure the type is correct for AssetDetailDialog
+            details.setdefault("type", "addon")
+            self._collected_details[asset_id] = details
+        else:
+            logging.warning(f"Unable to retrieve details for selected extension ID: {asset_id}")
+            self._details_errors.append(f"ID {asset_id}: {error_message}")
+
+        if self._pending_details:
+            # Progress arrives through queued signals; the label repaints once control returns to the event loop
+            total = len(self._details_order)
+            self.status_label.setText(f"Loaded {total - len(self._pending_details)}/{total} selected extensions...")
+        else:
+            detailed_assets = [self._collected_details[aid] for aid in self._details_order if aid in self._collected_details]
+            self._on_selected_details_fetched(detailed_assets, self._details_errors)
 
+    def _on_selected_details_fetched(self, detailed_assets: list, errors: list):
+        """Displays the selected extensions once all their details have been fetched."""
         # Re-enable controls before displaying
         self.search_button.setEnabled(True)
         self.search_edit.setEnabled(True)
@@ -2,16 +2,13 @@
 # gui/main_window.py
 
 import logging
-from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSlot, QUrl  # Spostato QUrl qui
-from PyQt6.QtGui import QFont, QIcon, QAction, QDesktopServices  # Rimosso QUrl da qui
+from PyQt6.QtCore import QTimer, QSize, QThreadPool, pyqtSlot, QUrl  # Spostato QUrl qui
+from PyQt6.QtGui import QIcon, QDesktopServices  # Rimosso QUrl da qui
 from PyQt6.QtWidgets import (
-    QApplication,
     QMainWindow,
     QMessageBox,
-    QTabWidget,
     QToolButton,
     QVBoxLayout,
     QWidget,
@@ -20,15 +17,13 @@ from PyQt6.QtWidgets import (
     QStackedWidget,
     QButtonGroup,
     QStyle,
-    QAbstractButton,
     QStatusBar,
-    QSpacerItem,
-    QSizePolicy,
     QDialog,
     QLabel,
 )
 
 # Import GUI classes and DataManager
+from api_clients import AssetDetailsFetcher
 from data_manager import DataManager # Use the DataManager class
 from gui.asset_detail_dialog import AssetDetailDialog # Import the dialog
 from gui.projects_tab import ProjectsTab
@@ -39,17 +34,13 @@ from gui.project_selection_dialog import ProjectSelectionDialog
 from gui.styles import (  # Import of new styles
     MAIN_STYLE,
     NAV_BUTTON_STYLE,
-    BUTTON_STYLE,
-    PRIMARY_BUTTON_STYLE,
-    COLORS
 )
-from project_handler import synchronize_projects_with_default_folder
-from utils import get_icon # Added for icon loading
-from version import VERSION, RELEASES_URL # Importo informazioni versione
+from version import VERSION # Importo informazioni versione
 from check_update import UpdateChecker # Importo il modulo per il controllo aggiornamenti
 
 # --- Constants ---
 WINDOW_TITLE = "Godot Launcher"
+NAV_ICON_SIZE = QSize(22, 22) # Size of the navigation button icons
 
 
 class MainWindow(QMainWindow):
@@ -57,6 +48,11 @@ class MainWindow(QMainWindow):
     The main application window, containing the navigation and page content.
     Uses a QStackedWidget managed by custom navigation buttons instead of QTabWidget.
     """
+    statusBar_widget: QStatusBar # Created in __init__ before any tab can emit a status message
+
+    # Standard icons shared by all MainWindow instances, filled on first use
+    _icon_cache: dict[QStyle.StandardPixmap, QIcon] = {}
+
     def __init__(self, data_manager: DataManager, parent: Optional[QWidget] = None):
         """
         Initializes the MainWindow.
@@ -73,6 +69,7 @@ class MainWindow(QMainWindow):
         
         # Create a status bar before initializing the UI
         self.statusBar_widget = QStatusBar()
+        self.statusBar_widget.setObjectName("statusBar") # Styled by MAIN_STYLE
         self.setStatusBar(self.statusBar_widget)
         
         # Apply the main style (dark theme)
@@ -80,6 +77,15 @@ class MainWindow(QMainWindow):
         
         # Stato controllo aggiornamenti
         self.update_checker = None
+
+        # Asset titles seen in detail dialogs (asset_id str -> title), used by the install flow
+        self._asset_title_cache: dict[str, str] = {}
+        # Selection dialogs waiting for their asset title (asset_id str -> dialog)
+        self._dialogs_awaiting_title: dict[str, ProjectSelectionDialog] = {}
+
+        # Message boxes reused across calls (created on first use, see _get_warning_box/_get_confirm_box)
+        self._warn_box: Optional[QMessageBox] = None
+        self._confirm_box: Optional[QMessageBox] = None
         
         self.init_ui()
         
@@ -93,6 +99,33 @@ class MainWindow(QMainWindow):
             
         logging.info("MainWindow initialized.")
 
+    @classmethod
+    def _nav_icons(cls, style: QStyle) -> tuple[QIcon, QIcon, QIcon]:
+        """
+        Returns the (projects, templates, extensions) navigation icons.
+
+        The icons are looked up in the style only once and then reused. Each cached icon
+        holds a single pixmap already rendered at NAV_ICON_SIZE, so painting a nav button
+        is a plain blit instead of a rescale of the multi-size standard icon.
+
+        Args:
+            style: The QStyle used to resolve the standard icons.
+
+        Returns:
+            A tuple with the three cached QIcon objects.
+        """
+        pixmaps = (
+            QStyle.StandardPixmap.SP_DirHomeIcon,
+            QStyle.StandardPixmap.SP_FileDialogContentsView,
+            QStyle.StandardPixmap.SP_FileDialogListView, # Puzzle icon for Extensions
+        )
+        for sp in pixmaps:
+            if sp not in cls._icon_cache:
+                icon = QIcon()
+                icon.addPixmap(style.standardIcon(sp).pixmap(NAV_ICON_SIZE))
+                cls._icon_cache[sp] = icon
+        return tuple(cls._icon_cache[sp] for sp in pixmaps)
+
     def init_ui(self):
         """Initializes the main window UI using a QStackedWidget and custom navigation."""
         logging.debug("Initializing MainWindow UI with StackedWidget")
@@ -112,18 +145,7 @@ class MainWindow(QMainWindow):
         self.settings_btn.setFont(font)
         self.settings_btn.setToolTip("Settings")
         self.settings_btn.clicked.connect(self.open_settings_dialog)
-        # Settings button style
-        self.settings_btn.setStyleSheet(f"""
-            QToolButton {{
-                background-color: transparent;
-                border: none;
-                color: {COLORS["text_primary"]};
-            }}
-            QToolButton:hover {{
-                background-color: {COLORS["muted"]};
-                border-radius: 4px;
-            }}
-        """)
+        self.settings_btn.setObjectName("settingsBtn") # Styled by MAIN_STYLE
         top_bar_layout.addWidget(self.settings_btn)
         self.main_layout.addLayout(top_bar_layout)
 
@@ -136,18 +158,14 @@ class MainWindow(QMainWindow):
 
         # Navigation panel with darker background
         nav_panel = QWidget()
-        nav_panel.setStyleSheet(f"background-color: {COLORS['bg_dark']}; border-radius: 8px;")
+        nav_panel.setObjectName("navPanel") # Styled by MAIN_STYLE
         nav_panel_layout = QHBoxLayout(nav_panel)
         nav_panel_layout.setContentsMargins(10, 10, 10, 10)
         nav_panel_layout.setSpacing(5)
 
         # Navigation Buttons (Tabs)
-        # Use standard Qt icons for a more integrated look
-        style = self.style()
-        icon_proj = style.standardIcon(QStyle.StandardPixmap.SP_DirHomeIcon)
-        icon_tmpl = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
-        # Use puzzle icon for Extensions
-        icon_ext = style.standardIcon(QStyle.StandardPixmap.SP_FileDialogListView) # Puzzle icon
+        # Use standard Qt icons for a more integrated look (cached at class level)
+        icon_proj, icon_tmpl, icon_ext = self._nav_icons(self.style())
 
         self.btn_projects = QPushButton(icon_proj, " Projects")
         self.btn_templates = QPushButton(icon_tmpl, " Templates")
@@ -160,43 +178,40 @@ class MainWindow(QMainWindow):
         for i, btn in enumerate(buttons):
             btn.setCheckable(True)
             btn.setStyleSheet(NAV_BUTTON_STYLE)
-            btn.setIconSize(QSize(22, 22)) # Increased icon size
-            self.nav_button_group.addButton(btn, i)
+            btn.setIconSize(NAV_ICON_SIZE) # Increased icon size
+            self.nav_button_group.addButton(btn, i) # Group only keeps the buttons exclusive
+            # Each button knows its page index: no group lookup needed on click
+            btn.clicked.connect(lambda checked, idx=i: self._change_page(idx))
             nav_panel_layout.addWidget(btn)
         nav_panel_layout.addStretch(1) # Stretch on the right to center buttons
-
-        self.nav_button_group.buttonClicked.connect(self._change_page)
         
         navigation_layout.addWidget(nav_panel)
         self.main_layout.addLayout(navigation_layout)
 
         # --- QStackedWidget for Pages ---
         self.stacked_widget = QStackedWidget()
-        # Style for the page container
-        self.stacked_widget.setStyleSheet(f"""
-            QStackedWidget {{
-                background-color: {COLORS['bg_content']};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        self.stacked_widget.setObjectName("pagesStack") # Page container, styled by MAIN_STYLE
 
         logging.debug("Creating Tab instances (now Pages)...")
         # Pass the DataManager instance to child widgets (pages)
         self.projects_tab = ProjectsTab(self.data_manager)
-        self.templates_tab = TemplatesTab(self.data_manager)
-        self.extensions_tab = ExtensionsTab(self.data_manager)
+        # Templates and Extensions are built on first navigation (see _ensure_page)
+        self.templates_tab: Optional[TemplatesTab] = None
+        self.extensions_tab: Optional[ExtensionsTab] = None
+        self._page_factories = {1: self._make_templates_tab, 2: self._make_extensions_tab}
 
-        # Add pages to the stack IN THE SAME ORDER as the buttons
-        pages = [self.projects_tab, self.templates_tab, self.extensions_tab]
+        # Add pages to the stack IN THE SAME ORDER as the buttons (placeholders for lazy pages)
+        pages = [self.projects_tab, QWidget(), QWidget()]
         for page_widget in pages:
             self.stacked_widget.addWidget(page_widget)
 
         self.main_layout.addWidget(self.stacked_widget, 1) # Stack takes remaining space
 
-        # Select the first page/button on startup
+        # Select the first page/button on startup (one repaint for both changes)
+        self.stacked_widget.setUpdatesEnabled(False)
         self.btn_projects.setChecked(True)
         self.stacked_widget.setCurrentIndex(0)
+        self.stacked_widget.setUpdatesEnabled(True)
 
         # --- Inter-Tab/Dialog Connections ---
         logging.debug("Connecting signals between Pages/Dialogs...")
@@ -206,8 +221,7 @@ class MainWindow(QMainWindow):
         # )
         # The signal is now emitted by AssetDetailDialog and handled by MainWindow
 
-        # Connect the signal from TemplatesTab that indicates a detail dialog needs connection
-        self.templates_tab.asset_detail_dialog_shown.connect(self.connect_asset_detail_signals)
+        # TemplatesTab/ExtensionsTab signals are connected in their factories
 
         # When the auto-install selection changes, potentially update Projects tab UI (if needed)
         # self.extensions_tab.auto_install_selection_changed.connect(self.projects_tab.update_install_button_state) # Example
@@ -215,28 +229,61 @@ class MainWindow(QMainWindow):
         # --- Status Bar ---
         # Use the status bar already created in __init__
         self.statusBar_widget.showMessage("Ready.", 3000) # Initial message, disappears after 3s
-        
-        # Style for the status bar
-        self.statusBar_widget.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {COLORS['bg_dark']};
-                color: {COLORS['text_secondary']};
-                border-top: 1px solid {COLORS['border']};
-                padding: 2px;
-            }}
-        """)
-
-        # Example: Connect a signal from a tab to update status bar
-        self.projects_tab.status_message.connect(self.show_status_message)
-        self.extensions_tab.status_message.connect(self.show_status_message)
-        self.templates_tab.status_message.connect(self.show_status_message)
+
+        # Connect the page signals once the event loop has painted the first frame
+        QTimer.singleShot(0, self._wire_deferred_signals)
 
         logging.debug("Finished MainWindow UI creation (StackedWidget)")
 
-    @pyqtSlot(AssetDetailDialog) # Expect an AssetDetailDialog instance
+    def _wire_deferred_signals(self):
+        """Connects the startup page signals; run after the first paint (lazy pages wire in their factories)."""
+        self._connect_page_signals(self.projects_tab)
+
+    def _connect_page_signals(self, page: QWidget):
+        """Connects the signals every page exposes (status_message) to MainWindow."""
+        page.status_message.connect(self.show_status_message)
+
+    def _make_templates_tab(self) -> TemplatesTab:
+        """Creates the Templates page and connects its signals."""
+        self.templates_tab = TemplatesTab(self.data_manager)
+        # Connect the signal from TemplatesTab that indicates a detail dialog needs connection
+        self.templates_tab.asset_detail_dialog_shown.connect(self.connect_asset_detail_signals)
+        self._connect_page_signals(self.templates_tab)
+        return self.templates_tab
+
+    def _make_extensions_tab(self) -> ExtensionsTab:
+        """Creates the Extensions page and connects its signals."""
+        self.extensions_tab = ExtensionsTab(self.data_manager)
+        # Its detail dialogs are wired like the Templates ones (install request + known title)
+        self.extensions_tab.asset_detail_dialog_shown.connect(self.connect_asset_detail_signals)
+        self._connect_page_signals(self.extensions_tab)
+        return self.extensions_tab
+
+    def _ensure_page(self, index: int):
+        """
+        Replaces the placeholder at the given stack index with the real page, if not built yet.
+
+        Args:
+            index: The stack index (same as the navigation button ID).
+        """
+        factory = self._page_factories.pop(index, None)
+        if factory is None:
+            return # Already built (or never lazy)
+        logging.debug("Building page %d on first navigation...", index)
+        placeholder = self.stacked_widget.widget(index)
+        page = factory()
+        self.stacked_widget.removeWidget(placeholder)
+        self.stacked_widget.insertWidget(index, page)
+        placeholder.deleteLater()
+
+    @pyqtSlot(object) # Receives an AssetDetailDialog; typed as object to skip the per-emit type lookup
     def connect_asset_detail_signals(self, dialog: AssetDetailDialog):
         """Connects signals from the AssetDetailDialog instance to MainWindow slots."""
-        logging.debug(f"Connecting signals for AssetDetailDialog (Asset ID: {dialog.asset_id})")
+        logging.debug("Connecting signals for AssetDetailDialog (Asset ID: %s)", dialog.asset_id)
+        # Remember the title so an install request doesn't need to fetch it again
+        title = dialog.initial_data.get('title')
+        if title:
+            self._asset_title_cache[dialog.asset_id] = title
         # Connect the template creation signal
         dialog.template_download_finished.connect(self.handle_template_project_created)
         # Connect the extension installation request signal
@@ -254,7 +301,7 @@ class MainWindow(QMainWindow):
         """Slot called when an AssetDetailDialog finishes (accepted or rejected)."""
         sender_dialog = self.sender()
         if isinstance(sender_dialog, AssetDetailDialog):
-            logging.debug(f"AssetDetailDialog (ID: {sender_dialog.asset_id}) finished with result: {result}. Attempting to disconnect signals.")
+            logging.debug("AssetDetailDialog (ID: %s) finished with result: %d. Attempting to disconnect signals.", sender_dialog.asset_id, result)
             # We don't need to manually disconnect other signals here,
             # Qt handles signal disconnection when the sender object (dialog) is deleted.
             # The dialog should be deleted shortly after finished is emitted.
@@ -264,7 +311,7 @@ class MainWindow(QMainWindow):
         else:
             logging.warning("on_asset_detail_dialog_finished called by unexpected sender type.")
 
-    @pyqtSlot(str, str)
+    @pyqtSlot(str, str) # Matches AssetDetailDialog.template_download_finished exactly (no conversion)
     def handle_template_project_created(self, project_name: str, project_path: str):
         """Handles the signal emitted when a project is successfully created from a template."""
         logging.info(f"MainWindow: Received template_download_finished signal. Project: '{project_name}', Path: '{project_path}'")
@@ -281,23 +328,22 @@ class MainWindow(QMainWindow):
             # Show a non-critical error, the project exists on disk but isn't tracked
             self.show_status_message(f"Error adding '{project_name}' to project list. Please restart or add manually.", 8000)
 
-        # Update the ProjectsTab
-        self.projects_tab.add_and_select_project(project_name, project_path)
+        # Update the ProjectsTab (the project is already in DataManager)
+        self.projects_tab.add_and_select_project(project_name, project_path, skip_data_manager_add=True)
         # Switch to the projects tab to show the result
         self.stacked_widget.setCurrentWidget(self.projects_tab)
         self.btn_projects.setChecked(True)
 
-    @pyqtSlot(QAbstractButton)
-    def _change_page(self, clicked_button: QAbstractButton):
-        """Switches the visible page in the QStackedWidget based on the clicked navigation button."""
-        # Get the ID associated with the clicked button
-        button_id = self.nav_button_group.id(clicked_button)
-        logging.info(f"Page change requested to button ID: {button_id} ({clicked_button.text()})")
-        if button_id != -1: # Check if the ID is valid
-            self.stacked_widget.setCurrentIndex(button_id)
-        else:
-            # This should not happen if buttons are correctly added to the group
-            logging.warning(f"Received click from button not belonging to the group: {clicked_button}")
+    def _change_page(self, index: int):
+        """
+        Switches the visible page in the QStackedWidget.
+
+        Args:
+            index: The page index (same as the navigation button ID).
+        """
+        logging.info("Page change requested to index: %d", index)
+        self._ensure_page(index)
+        self.stacked_widget.setCurrentIndex(index)
 
     def open_settings_dialog(self):
         """Opens the settings dialog window."""
@@ -312,9 +358,14 @@ class MainWindow(QMainWindow):
         dialog.exec() # Show modally
         logging.info("Settings Dialog closed.")
 
-    def update_status_godot_path(self):
-        """Updates the status bar when the Godot path changes via settings."""
-        godot_path = self.data_manager.get_godot_path()
+    @pyqtSlot(str)
+    def update_status_godot_path(self, godot_path: str):
+        """
+        Updates the status bar when the Godot path changes via settings.
+
+        Args:
+            godot_path: The new default Godot path ("" if it was cleared).
+        """
         if godot_path:
             self.show_status_message(f"Default Godot path updated: {godot_path}", 5000)
         else:
@@ -322,41 +373,38 @@ class MainWindow(QMainWindow):
 
     def show_status_message(self, message: str, timeout: int = 3000):
         """Displays a message in the status bar."""
-        logging.debug(f"Status update: {message} (timeout: {timeout}ms)")
-        if hasattr(self, 'statusBar_widget'):
-            self.statusBar_widget.showMessage(message, timeout)
+        # Lazy %-formatting: the message is only built when DEBUG is enabled (hot slot)
+        logging.debug("Status update: %s (timeout: %dms)", message, timeout)
+        self.statusBar_widget.showMessage(message, timeout)
 
     @pyqtSlot(int)
     def handle_install_extension_request(self, asset_id: int):
         """Handles the request to install an extension, usually emitted from AssetDetailDialog."""
         logging.info(f"MainWindow: Received install request for extension ID {asset_id}")
         
-        # Get extension details
-        try:
-            from api_clients import fetch_asset_details_sync
-            extension_details = fetch_asset_details_sync(asset_id)
-            extension_name = extension_details.get('title', f"Extension #{asset_id}")
-        except Exception as e:
-            logging.error(f"Failed to fetch details for extension {asset_id}: {e}")
-            extension_name = f"Extension #{asset_id}"
-            
         # Check if there are projects available in the DataManager
         projects = self.data_manager.get_projects()
         if not projects:
             logging.warning("Extension install requested, but no projects are available.")
-            QMessageBox.warning(
-                self, 
-                "No Projects Available", 
-                "Before installing an extension, you must create or import at least one project."
-            )
+            box = self._get_warning_box()
+            box.setWindowTitle("No Projects Available")
+            box.setText("Before installing an extension, you must create or import at least one project.")
+            box.exec()
             return
             
-        # Import the project selection dialog
-        from gui.project_selection_dialog import ProjectSelectionDialog
-        
+        # Use the title seen in the detail dialog; otherwise fetch it in the background
+        asset_key = str(asset_id)
+        extension_name = self._asset_title_cache.get(asset_key)
+        dialog = ProjectSelectionDialog(self.data_manager, asset_id, extension_name or f"Extension #{asset_id}", self)
+        if extension_name is None:
+            self._dialogs_awaiting_title[asset_key] = dialog
+            fetcher = AssetDetailsFetcher(0, asset_key)
+            fetcher.signals.finished.connect(self._on_install_title_fetched)
+            QThreadPool.globalInstance().start(fetcher)
+
         # Show the project selection dialog
-        dialog = ProjectSelectionDialog(self.data_manager, asset_id, extension_name, self)
         result = dialog.exec()
+        self._dialogs_awaiting_title.pop(asset_key, None)
         
         if result == QDialog.DialogCode.Accepted:
             # Get selected projects
@@ -368,35 +416,76 @@ class MainWindow(QMainWindow):
                 return
                 
             # Delegate installation to ProjectsTab for the selected projects
-            self.projects_tab.start_multi_project_extension_installation(asset_id, selected_projects)
+            # The background fetch above may still be running: fall back to the generic name rather than fetching again
+            self.projects_tab.start_multi_project_extension_installation(
+                asset_id, selected_projects, self._asset_title_cache.get(asset_key, f"Extension #{asset_id}")
+            )
         else:
             logging.info(f"User cancelled installation of extension ID {asset_id}")
             
+    def _get_warning_box(self) -> QMessageBox:
+        """Returns the reusable warning message box (OK button only)."""
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(self)
+            self._warn_box.setIcon(QMessageBox.Icon.Warning)
+            self._warn_box.setStandardButtons(QMessageBox.StandardButton.Ok)
+        return self._warn_box
+
+    def _get_confirm_box(self) -> QMessageBox:
+        """Returns the reusable Yes/No confirmation message box."""
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        return self._confirm_box
+
+    @pyqtSlot(int, str, object, str)
+    def _on_install_title_fetched(self, batch_id: int, asset_id: str, details: Optional[dict], error_msg: str):
+        """Updates the project selection dialog once the extension title has been fetched."""
+        if error_msg or not details:
+            logging.error(f"Failed to fetch details for extension {asset_id}: {error_msg}")
+            return
+        title = details.get('title')
+        if not title:
+            return
+        self._asset_title_cache[asset_id] = title
+        dialog = self._dialogs_awaiting_title.pop(asset_id, None)
+        if dialog is not None:
+            dialog.set_asset_name(title)
+
     def closeEvent(self, event):
         """Handles the application close event, checking for ongoing operations."""
         logging.info("Application close requested...")
 
         # Check if any background operations are running in the tabs
-        template_op_running = (self.templates_tab.download_thread and self.templates_tab.download_thread.isRunning()) or \
-                              (self.templates_tab.api_thread and self.templates_tab.api_thread.isRunning())
+        # The Templates page may never have been opened (built lazily)
+        template_op_running = False
+        if self.templates_tab is not None:
+            t_dl = self.templates_tab.download_thread
+            t_api = self.templates_tab.api_thread
+            template_op_running = bool((t_dl and t_dl.isRunning()) or (t_api and t_api.isRunning()))
         project_creation_running = self.projects_tab.auto_installer_cancel_func is not None
         project_install_running = self.projects_tab.multi_install_cancel_func is not None
+        project_sync_running = self.projects_tab.is_sync_running()
 
-        if template_op_running or project_creation_running or project_install_running:
-            ops_in_progress = []
-            if template_op_running: ops_in_progress.append("Template Download/Search")
-            if project_creation_running: ops_in_progress.append("Project Creation/Auto-Install")
-            if project_install_running: ops_in_progress.append("Extension Installation")
+        ops_in_progress = [name for running, name in (
+            (template_op_running, "Template Download/Search"),
+            (project_creation_running, "Project Creation/Auto-Install"),
+            (project_install_running, "Extension Installation"),
+            (project_sync_running, "Project Synchronization"),
+        ) if running]
 
+        if ops_in_progress:
             logging.warning(f"Attempting to close with operations in progress: {ops_in_progress}")
-            reply = QMessageBox.question(
-                self, "Exit Confirmation",
-                f"Operations are in progress:\n- {'\n- '.join(ops_in_progress)}\n\nExit and cancel these operations?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No, # Default to No
-            )
-
-            if reply == QMessageBox.StandardButton.No:
+            ops_text = "\n- ".join(ops_in_progress) # Joined outside the f-string (no backslashes allowed there before 3.12)
+            box = self._get_confirm_box()
+            box.setWindowTitle("Exit Confirmation")
+            box.setText(f"Operations are in progress:\n- {ops_text}\n\nExit and cancel these operations?")
+            box.setDefaultButton(QMessageBox.StandardButton.No) # Default to No
+            box.exec()
+            reply = box.standardButton(box.clickedButton())
+
+            if reply != QMessageBox.StandardButton.Yes: # No or closed via Esc
                 logging.info("Application close cancelled by user.")
                 event.ignore() # Prevent closing
                 return
@@ -406,6 +495,9 @@ class MainWindow(QMainWindow):
                 if template_op_running: self.templates_tab.cancel_current_operation()
                 if project_creation_running: self.projects_tab.cancel_project_creation_or_auto_install()
                 if project_install_running: self.projects_tab.cancel_selected_extensions_installation()
+                # The folder scan cannot be interrupted: let it end (its result is discarded) before the thread is torn down
+                if project_sync_running and not self.projects_tab.wait_for_sync():
+                    logging.warning("Project synchronization did not finish before exit.")
                 # Allow event loop to process cancellations briefly? Might not be necessary.
                 self.perform_final_save_and_accept(event) # Proceed with saving and closing
         else:
@@ -416,8 +508,8 @@ class MainWindow(QMainWindow):
         """Performs the final data save and accepts the close event."""
         logging.info("Saving final application data...")
         try:
-            # Use the save_data method of the DataManager instance
-            self.data_manager.save_data()
+            # Setters save in the background (debounced): wait for it and write what is still pending
+            self.data_manager.flush_pending_save(timeout=2.0)
             logging.info("Application data saved. Closing application.")
             event.accept() # Allow the window to close
         except Exception as e:
@@ -429,7 +521,7 @@ class MainWindow(QMainWindow):
     def add_version_label(self):
         """Aggiunge l'etichetta della versione alla status bar."""
         version_label = QLabel(f"Versione: {VERSION}")
-        version_label.setStyleSheet(f"color: {COLORS['muted']}; padding-right: 5px;")
+        version_label.setObjectName("versionLabel") # Stile definito in MAIN_STYLE
         self.statusBar_widget.addPermanentWidget(version_label)  # Usa addPermanentWidget per posizionare a destra
 
     def check_for_updates(self):
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 # gui/new_project_dialog.py
 
+import functools
 import logging
 import os
 import re
+import time
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QColor, QPalette
 from PyQt6.QtWidgets import (
     QButtonGroup,
@@ -34,6 +36,43 @@ from PyQt6.QtWidgets import (
 # Import DataManager
 from data_manager import DataManager # Import the class
 
+# --- Constants ---
+VALIDATION_DEBOUNCE_MS = 200 # Delay after the last keystroke before the path is recomputed/validated
+STAT_CACHE_TTL = 2.0 # Seconds a cached exists() result for a candidate project folder stays valid
+
+# Folder-name sanitization patterns and forbidden project-name characters (built once)
+_WS_RE = re.compile(r"\s+")
+_NONWORD_RE = re.compile(r"[^\w\-]+")
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+_SAFE_FOLDER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-") # Names made only of these need no regex
+
+# Stylesheets for the plain-text path/status labels, by color (avoids re-parsing rich text on each update)
+_LABEL_STYLES = {
+    color: f"font-size: 9pt; color: {color};" for color in ("gray", "red", "orange", "green")
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _sanitize_folder_name(name: str) -> str:
+    """
+    Generates a safe folder name from a project name (memoized: edits often revisit the same strings).
+
+    Args:
+        name: The project name as typed by the user.
+
+    Returns:
+        The lowercase folder name (letters, numbers, underscore, hyphen), or a fallback if empty.
+    """
+    base = name.lower()
+    if not _SAFE_FOLDER_CHARS.issuperset(base):
+        # Replace whitespace with underscores
+        base = _WS_RE.sub("_", base)
+        # Remove characters not suitable for folder names (allow letters, numbers, underscore, hyphen)
+        base = _NONWORD_RE.sub("", base)
+    # (else: already a safe ASCII folder name, e.g. "my_project": the substitutions would be no-ops)
+    # Remove leading/trailing underscores or hyphens; fallback if the name becomes empty
+    return base.strip("_-") or "new_godot_project"
+
 
 class NewProjectDialog(QDialog):
     """Custom dialog for creating a new Godot project."""
@@ -57,10 +96,25 @@ class NewProjectDialog(QDialog):
         self.parent_path: str = self.data_manager.get_default_projects_folder() or str(Path.home())
         self.final_project_path: Optional[Path] = None # The calculated full path for the new project
         self.selected_renderer: str = "forward_plus" # Default renderer
-        self.include_extensions: bool = bool(self.data_manager.get_auto_install_extensions()) # Default based on DataManager
-        self.edit_now: bool = True # Default to True
+        # include_extensions / edit_now are read from their checkboxes (see the properties below)
+        # Filesystem checks used by validation: {path_str: (timestamp, exists)} and the parent folder state
+        self._stat_cache: dict[str, tuple[float, bool]] = {}
+        self._parent_is_dir: bool = Path(self.parent_path).is_dir()
+        self._label_colors: dict[QLabel, str] = {} # Color currently applied to each path/status label
+        self._browse_dialog: Optional[QFileDialog] = None # Folder picker, created on first Browse and reused
+        # Last validation input and its result, to skip repeated passes on unchanged input
+        self._last_validation_key: Optional[tuple] = None
+        self._last_validation_result: bool = False
+        # Registered project names, snapshotted once: checked on every validation pass
+        self._known_project_names: frozenset[str] = frozenset(self.data_manager.get_projects().keys())
         # self.version_control: str = "None" # Default VCS (currently commented out)
 
+        # Debounce timer: name edits revalidate once per typing burst, not per keystroke
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(VALIDATION_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self._update_final_path)
+
         # Setup UI
         self._init_ui()
         self._connect_signals()
@@ -93,7 +147,9 @@ class NewProjectDialog(QDialog):
         # Label to display the final calculated project path
         self.final_path_label = QLabel("...")
         self.final_path_label.setWordWrap(True)
-        self.final_path_label.setStyleSheet("font-size: 9pt; color: gray;")
+        self.final_path_label.setTextFormat(Qt.TextFormat.PlainText) # Color comes from the stylesheet
+        self.final_path_label.setStyleSheet(_LABEL_STYLES["gray"])
+        self._label_colors[self.final_path_label] = "gray"
         form_layout.addRow("Final Project Path:", self.final_path_label)
 
         main_layout.addLayout(form_layout)
@@ -101,7 +157,9 @@ class NewProjectDialog(QDialog):
         # Status label for path validation feedback
         main_layout.addSpacing(5)
         self.path_status_label = QLabel("...")
-        self.path_status_label.setStyleSheet("font-size: 9pt; color: gray;")
+        self.path_status_label.setTextFormat(Qt.TextFormat.PlainText) # Color comes from the stylesheet
+        self.path_status_label.setStyleSheet(_LABEL_STYLES["gray"])
+        self._label_colors[self.path_status_label] = "gray"
         main_layout.addWidget(self.path_status_label)
 
         main_layout.addSpacing(15)
@@ -143,14 +201,14 @@ class NewProjectDialog(QDialog):
         # Include Default Extensions Checkbox
         num_extensions = len(self.data_manager.get_auto_install_extensions())
         self.include_extensions_checkbox = QCheckBox(f"Include {num_extensions} Default Extension(s)")
-        self.include_extensions_checkbox.setChecked(self.include_extensions)
+        self.include_extensions_checkbox.setChecked(num_extensions > 0) # Default based on DataManager
         self.include_extensions_checkbox.setToolTip(f"Automatically install the {num_extensions} extension(s) marked for auto-install.")
         self.include_extensions_checkbox.setEnabled(num_extensions > 0) # Only enable if there are extensions
         options_layout.addWidget(self.include_extensions_checkbox)
 
         # Edit Project Now Checkbox
         self.edit_now_checkbox = QCheckBox("Edit Project After Creation")
-        self.edit_now_checkbox.setChecked(self.edit_now)
+        self.edit_now_checkbox.setChecked(True) # Default to True
         self.edit_now_checkbox.setToolTip("Automatically open the Godot editor for the new project after it is created.")
         options_layout.addWidget(self.edit_now_checkbox)
 
@@ -181,15 +239,13 @@ class NewProjectDialog(QDialog):
 
     def _connect_signals(self):
         """Connects UI element signals to appropriate slots."""
-        self.name_edit.textChanged.connect(self._update_final_path)
+        # start() restarts the single-shot timer if it is already running (debounce)
+        self.name_edit.textChanged.connect(self._validate_timer.start)
         self.browse_path_btn.clicked.connect(self._browse_parent_path)
         # Connect renderer selection change
         self.renderer_button_group.buttonClicked.connect(self._renderer_changed)
         # Connect VCS change if uncommented
         # self.vcs_combo.currentTextChanged.connect(self._vcs_changed)
-        # Connect checkbox changes
-        self.include_extensions_checkbox.stateChanged.connect(self._include_extensions_changed)
-        self.edit_now_checkbox.stateChanged.connect(self._edit_now_changed)
 
     @pyqtSlot(QAbstractButton)
     def _renderer_changed(self, button: QAbstractButton):
@@ -198,22 +254,28 @@ class NewProjectDialog(QDialog):
             renderer_name = button.property("renderer_name")
             if renderer_name:
                 self.selected_renderer = renderer_name
-                logging.debug(f"Selected renderer: {self.selected_renderer}")
+                logging.debug("Selected renderer: %s", self.selected_renderer)
             else:
                 # This should not happen if properties are set correctly
                 logging.warning("Renderer radio button clicked without 'renderer_name' property.")
 
     def _browse_parent_path(self):
         """Opens a dialog to select the parent folder for the new project."""
-        current_parent = self.parent_path
-        selected_dir = QFileDialog.getExistingDirectory(
-            self,
-            "Select Parent Folder", # Dialog title
-            current_parent, # Starting directory
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks,
-        )
+        # Reuse one dialog: building it (sidebar, directory model) is the slow part
+        if self._browse_dialog is None:
+            self._browse_dialog = QFileDialog(self, "Select Parent Folder")
+            self._browse_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._browse_dialog.setOptions(QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks)
+        self._browse_dialog.setDirectory(self.parent_path) # Starting directory
+        if not self._browse_dialog.exec():
+            return
+        selected_files = self._browse_dialog.selectedFiles()
+        selected_dir = selected_files[0] if selected_files else ""
         if selected_dir and selected_dir != self.parent_path:
             self.parent_path = selected_dir
+            # The parent changed: recompute its state and drop cached checks for the old one
+            self._parent_is_dir = Path(selected_dir).is_dir()
+            self._stat_cache.clear()
             self.path_edit.setText(selected_dir) # Update read-only line edit
             self._update_final_path() # Update final path display and validation
 
@@ -224,39 +286,60 @@ class NewProjectDialog(QDialog):
 
         if not self.project_name:
             self.final_project_path = None
-            self.final_path_label.setText("<font color='orange'>Please enter a project name.</font>")
+            self._set_label(self.final_path_label, "Please enter a project name.", "orange")
             self._validate_path() # Still validate to disable OK button
             return
 
         # --- Generate a safe folder name from the project name ---
-        folder_name_base = self.project_name.lower()
-        # Replace whitespace with underscores
-        folder_name_base = re.sub(r"\s+", "_", folder_name_base)
-        # Remove characters not suitable for folder names (allow letters, numbers, underscore, hyphen)
-        folder_name_base = re.sub(r"[^\w\-]+", "", folder_name_base)
-        # Remove leading/trailing underscores or hyphens
-        folder_name = folder_name_base.strip("_-")
-        # Fallback if the name becomes empty after sanitization
-        if not folder_name:
-            folder_name = "new_godot_project"
-        logging.debug(f"Project name: '{self.project_name}' -> Generated folder name: '{folder_name}'")
+        folder_name = _sanitize_folder_name(self.project_name)
+        logging.debug("Project name: %r -> Generated folder name: %r", self.project_name, folder_name) # Lazy: runs per typing burst
 
         # Construct the final path using the generated folder name
         try:
             self.final_project_path = parent / folder_name
             # Display both the final path and the original project name
-            self.final_path_label.setText(f"{self.final_project_path}\n(Project Name: '{self.project_name}')")
-            self.final_path_label.setStyleSheet("font-size: 9pt; color: gray;")
+            self._set_label(self.final_path_label, f"{self.final_project_path}\n(Project Name: '{self.project_name}')", "gray")
         except Exception as e: # Catch potential errors creating the Path object
             logging.warning(f"Error constructing final path: {e}")
             self.final_project_path = None
-            self.final_path_label.setText("<font color='red'>Invalid project name or parent folder.</font>")
-            self.final_path_label.setStyleSheet("font-size: 9pt; color: red;")
+            self._set_label(self.final_path_label, "Invalid project name or parent folder.", "red")
 
         self._validate_path() # Validate the generated path
 
+    def _set_label(self, label: QLabel, text: str, color: str):
+        """Sets the plain text of a path/status label, changing its stylesheet only if the color changed."""
+        if self._label_colors.get(label) != color:
+            label.setStyleSheet(_LABEL_STYLES[color])
+            self._label_colors[label] = color
+        label.setText(text)
+
+    def _cached_exists(self, path: Path, ttl: float = STAT_CACHE_TTL) -> bool:
+        """
+        Returns path.exists(), reusing a result obtained less than `ttl` seconds ago.
+
+        Args:
+            path: The path to check.
+            ttl: Maximum age in seconds of a cached result.
+
+        Returns:
+            True if the path exists.
+        """
+        key = str(path)
+        now = time.monotonic()
+        cached = self._stat_cache.get(key)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        exists = path.exists()
+        self._stat_cache[key] = (now, exists)
+        return exists
+
     def _validate_path(self) -> bool:
         """Validates the project name and the final calculated path."""
+        # Nothing changed since the last pass: labels and button already show its result
+        key = (self.project_name, self.parent_path, str(self.final_project_path))
+        if key == self._last_validation_key:
+            return self._last_validation_result
+
         is_valid = False
         status_text = ""
         text_color = "red" # Default to error color
@@ -266,10 +349,10 @@ class NewProjectDialog(QDialog):
         if not self.project_name:
             status_text = "Project name cannot be empty."
         # Check for invalid characters in the *project name* itself (might be used elsewhere)
-        elif any(c in '<>:"/\\|?*' for c in self.project_name):
+        elif not _INVALID_NAME_CHARS.isdisjoint(self.project_name):
             status_text = "Project name contains invalid characters."
         # Check if project name is already registered (using DataManager)
-        elif self.project_name in self.data_manager.get_projects():
+        elif self.project_name in self._known_project_names:
             status_text = f"A project named '{self.project_name}' is already registered."
             text_color = "orange" # Warning color for existing name
 
@@ -277,12 +360,12 @@ class NewProjectDialog(QDialog):
         elif self.final_project_path is None:
             # This occurs if parent_path was invalid during _update_final_path
             status_text = "Invalid parent folder selected."
-        elif self.final_project_path.exists():
+        elif self._cached_exists(self.final_project_path):
             # The calculated folder name already exists in the parent directory
             folder_name = self.final_project_path.name
             status_text = f"Folder '{folder_name}' already exists in '{self.parent_path}'."
             text_color = "orange" # Warning color for existing folder
-        elif not self.final_project_path.parent.is_dir():
+        elif not self._parent_is_dir:
              # Parent directory check (should be redundant if browse dialog worked, but safe)
              status_text = "Selected parent folder is not a valid directory."
         else:
@@ -293,14 +376,16 @@ class NewProjectDialog(QDialog):
             is_valid = True
 
         # Update status label and OK button state
-        self.path_status_label.setText(f"<font color='{text_color}'>{status_text}</font>")
+        self._set_label(self.path_status_label, status_text, text_color)
         self.create_button.setEnabled(is_valid)
+        self._last_validation_key = key
+        self._last_validation_result = is_valid
         return is_valid
 
     # Optional slots for handling VCS changes (if uncommented in UI)
     # def _vcs_changed(self, text):
     #     self.version_control = text
-    #     logging.debug(f"Selected version control: {self.version_control}")
+    #     logging.debug("Selected version control: %s", self.version_control)
 
     def get_project_details(self) -> Optional[dict]:
         """Returns the selected project details if valid, otherwise None."""
@@ -309,25 +394,31 @@ class NewProjectDialog(QDialog):
                 "name": self.project_name,
                 "path": self.final_project_path,
                 "renderer": self.selected_renderer,
-                "include_extensions": self.include_extensions,
-                "edit_now": self.edit_now,
+                "include_extensions": self.include_extensions_checkbox.isChecked(),
+                "edit_now": self.edit_now_checkbox.isChecked(),
                 # "vcs": self.version_control # Include if VCS is uncommented
             }
         return None
 
-    # Add slots for checkbox changes
-    @pyqtSlot(int)
-    def _include_extensions_changed(self, state: int):
-        self.include_extensions = state == Qt.CheckState.Checked.value
-        logging.debug(f"Include extensions set to: {self.include_extensions}")
+    # Checkbox options are only needed at submit time: read them directly instead of tracking toggles
+    @property
+    def include_extensions(self) -> bool:
+        """Whether the auto-install extensions should be installed in the new project."""
+        return self.include_extensions_checkbox.isChecked()
 
-    @pyqtSlot(int)
-    def _edit_now_changed(self, state: int):
-        self.edit_now = state == Qt.CheckState.Checked.value
-        logging.debug(f"Edit now set to: {self.edit_now}")
+    @property
+    def edit_now(self) -> bool:
+        """Whether the editor should be opened after the project is created."""
+        return self.edit_now_checkbox.isChecked()
 
     def accept(self):
         """Overrides accept to perform final validation before closing."""
+        # Flush a pending debounced update so the latest typed name is used,
+        # and force one fresh validation (the target folder may have appeared meanwhile)
+        self._validate_timer.stop()
+        self._last_validation_key = None
+        self._stat_cache.clear()
+        self._update_final_path()
         if self._validate_path(): # Perform final validation
             logging.info(f"Create project dialog accepted. Name: '{self.project_name}', Path: '{self.final_project_path}', Renderer: '{self.selected_renderer}'")
             super().accept() # Close dialog with Accepted code
@@ -2,10 +2,11 @@
 # gui/project_selection_dialog.py
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,7 +15,6 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QListWidget,
     QListWidgetItem,
-    QCheckBox,
     QDialogButtonBox,
     QAbstractItemView,
     QMessageBox,
@@ -26,12 +26,62 @@ from gui.styles import (  # Import of new styles
     PRIMARY_BUTTON_STYLE,
     DIALOG_STYLE,
     INPUT_STYLE,
-    LIST_WIDGET_STYLE,
-    CHECKBOX_STYLE,
+    CHECKABLE_LIST_WIDGET_STYLE,
     COLORS
 )
 
 
+def _is_valid_project_dir(path_str: str) -> bool:
+    """
+    Checks whether a registered project path still contains a Godot project.
+
+    A single stat of <path>/project.godot is enough: if it is a regular file, the
+    project folder necessarily exists and is a directory.
+
+    Args:
+        path_str: The project folder path.
+
+    Returns:
+        True if <path>/project.godot exists and is a file.
+    """
+    return os.path.isfile(os.path.join(path_str, "project.godot"))
+
+
+# Item data role holding the plain project name (the text may carry an "(invalid path)" suffix)
+PROJECT_NAME_ROLE = Qt.ItemDataRole.UserRole.value + 1
+PATH_VALIDATION_MAX_WORKERS = 8 # Concurrent project path checks (slow/network disks)
+
+
+class ProjectPathValidatorSignals(QObject):
+    """Container for signals emitted by ProjectPathValidator."""
+    validated = pyqtSignal(int, bool) # list row, is_valid
+
+
+class ProjectPathValidator(QRunnable):
+    """A QRunnable task checking one project path off the UI thread."""
+    def __init__(self, row: int, path_str: str):
+        """
+        Initializes the ProjectPathValidator.
+
+        Args:
+            row: Row of the project in the list (echoed back in the signal).
+            path_str: The project folder path to check.
+        """
+        super().__init__()
+        self.row = row
+        self.path_str = path_str
+        self.signals = ProjectPathValidatorSignals()
+
+    def run(self):
+        """Checks the path and emits the result."""
+        try:
+            is_valid = _is_valid_project_dir(self.path_str)
+        except Exception as e:
+            logging.error(f"Error validating project path '{self.path_str}': {e}")
+            is_valid = False
+        self.signals.validated.emit(self.row, is_valid)
+
+
 class ProjectSelectionDialog(QDialog):
     """
     Dialog that allows the user to select one or more projects for extension installation.
@@ -53,21 +103,33 @@ class ProjectSelectionDialog(QDialog):
         self.asset_id = asset_id
         self.asset_name = asset_name
         self.selected_projects: List[Tuple[str, Path]] = []  # [(project_name, path), ...]
+        self._projects_snapshot: Optional[Dict[str, str]] = None  # Copy of the projects taken once from DataManager
+        self._populated = False  # The list is filled on first show (see showEvent)
+        self._project_items: List[QListWidgetItem] = []  # Project rows in list order (avoids item(i) lookups)
+        self._no_selection_msg: Optional[QMessageBox] = None  # Styled warning, built once on first use
+        self.validation_pool = QThreadPool()  # Project path checks run here, results arrive via signals
+        self.validation_pool.setMaxThreadCount(PATH_VALIDATION_MAX_WORKERS)
         self.setWindowTitle("Select Projects for Installation")
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
         self.setStyleSheet(DIALOG_STYLE)  # Apply dialog style
         self.init_ui()
-        self.populate_projects_list()
+
+    def showEvent(self, event):
+        """Fills the project list after the dialog's first paint, so opening it isn't delayed by path checks."""
+        super().showEvent(event)
+        if not self._populated:
+            self._populated = True
+            QTimer.singleShot(0, self.populate_projects_list)
 
     def init_ui(self):
         """Initializes the dialog user interface."""
         layout = QVBoxLayout(self)
 
         # Title and information label
-        title_label = QLabel(f"<h3>Install '{self.asset_name}'</h3>")
-        title_label.setStyleSheet(f"color: {COLORS['text_primary']};")
-        layout.addWidget(title_label)
+        self.title_label = QLabel(f"<h3>Install '{self.asset_name}'</h3>")
+        self.title_label.setStyleSheet(f"color: {COLORS['text_primary']};")
+        layout.addWidget(self.title_label)
         
         info_label = QLabel(
             "Select the projects where you want to install this extension. "
@@ -79,7 +141,7 @@ class ProjectSelectionDialog(QDialog):
 
         # Project list with checkboxes
         self.projects_list = QListWidget()
-        self.projects_list.setStyleSheet(LIST_WIDGET_STYLE)
+        self.projects_list.setStyleSheet(CHECKABLE_LIST_WIDGET_STYLE) # Parsed once for all rows and their checkboxes
         self.projects_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         layout.addWidget(self.projects_list, 1)  # Takes available space
 
@@ -123,9 +185,22 @@ class ProjectSelectionDialog(QDialog):
         self.select_all_btn.clicked.connect(self.select_all_projects)
         self.deselect_all_btn.clicked.connect(self.deselect_all_projects)
 
+    def set_asset_name(self, asset_name: str):
+        """
+        Updates the extension name shown in the dialog header.
+
+        Args:
+            asset_name: The new name of the extension.
+        """
+        self.asset_name = asset_name
+        self.title_label.setText(f"<h3>Install '{asset_name}'</h3>")
+
     def populate_projects_list(self):
         """Populates the project list from the DataManager."""
-        projects = self.data_manager.get_projects()
+        # Query DataManager only once per dialog; re-populating reuses the snapshot
+        if self._projects_snapshot is None:
+            self._projects_snapshot = dict(self.data_manager.get_projects())
+        projects = self._projects_snapshot
         
         if not projects:
             # No projects available
@@ -140,58 +215,67 @@ class ProjectSelectionDialog(QDialog):
         # Sort projects by name
         sorted_projects = sorted(projects.items())
         
+        # Build all rows with painting/signals suspended: one repaint instead of one per row
+        self.projects_list.setUpdatesEnabled(False)
+        self.projects_list.blockSignals(True)
+        try:
+            self._add_project_items(sorted_projects)
+        finally:
+            self.projects_list.blockSignals(False)
+            self.projects_list.setUpdatesEnabled(True)
+
+        # Check the paths concurrently; rows become selectable as results arrive
+        for row, (_project_name, path_str) in enumerate(sorted_projects):
+            validator = ProjectPathValidator(row, path_str)
+            validator.signals.validated.connect(self._on_project_path_validated)
+            self.validation_pool.start(validator)
+
+    def _add_project_items(self, sorted_projects: List[Tuple[str, str]]):
+        """Adds one checkable row per (project_name, path_str) to the projects list, pending validation."""
         for project_name, path_str in sorted_projects:
-            item = QListWidgetItem()
-            self.projects_list.addItem(item)
-            
-            # Create checkbox with project name
-            checkbox = QCheckBox(project_name)
-            checkbox.setStyleSheet(CHECKBOX_STYLE)
-            
-            # Verify that the path is valid
-            try:
-                proj_path = Path(path_str)
-                is_valid = proj_path.is_dir() and (proj_path / "project.godot").is_file()
-                
-                if not is_valid:
-                    checkbox.setEnabled(False)
-                    checkbox.setText(f"{project_name} (invalid path)")
-            except Exception as e:
-                logging.error(f"Error validating project path '{project_name}': {e}")
-                checkbox.setEnabled(False)
-                checkbox.setText(f"{project_name} (invalid path)")
+            # Checkable item: the list draws the checkbox itself (no per-row widget)
+            # Not enabled until its path has been checked (see _on_project_path_validated)
+            item = QListWidgetItem(f"{project_name} (checking...)")
+            item.setFlags(Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
             
-            # Store the path as item data
+            # Store the path and the plain project name as item data
             item.setData(Qt.ItemDataRole.UserRole, path_str)
-            
-            # Set custom widget for the item
-            self.projects_list.setItemWidget(item, checkbox)
+            item.setData(PROJECT_NAME_ROLE, project_name)
+            self.projects_list.addItem(item)
+            self._project_items.append(item)
+
+    @pyqtSlot(int, bool)
+    def _on_project_path_validated(self, row: int, is_valid: bool):
+        """Enables a project row once its path is confirmed valid, or marks it invalid."""
+        if row >= len(self._project_items):
+            return
+        item = self._project_items[row]
+        project_name = item.data(PROJECT_NAME_ROLE)
+        if is_valid:
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setText(project_name)
+        else:
+            item.setText(f"{project_name} (invalid path)") # Stays disabled: can't be checked
 
     def select_all_projects(self):
         """Selects all valid projects in the list."""
-        for i in range(self.projects_list.count()):
-            item = self.projects_list.item(i)
-            widget = self.projects_list.itemWidget(item)
-            if isinstance(widget, QCheckBox) and widget.isEnabled():
-                widget.setChecked(True)
+        for item in self._project_items:
+            if item.flags() & Qt.ItemFlag.ItemIsEnabled:
+                item.setCheckState(Qt.CheckState.Checked)
 
     def deselect_all_projects(self):
         """Deselects all projects in the list."""
-        for i in range(self.projects_list.count()):
-            item = self.projects_list.item(i)
-            widget = self.projects_list.itemWidget(item)
-            if isinstance(widget, QCheckBox):
-                widget.setChecked(False)
+        for item in self._project_items:
+            item.setCheckState(Qt.CheckState.Unchecked)
 
     def accept(self):
         """Handles dialog acceptance, checking that at least one project is selected."""
         self.selected_projects = []
         
-        for i in range(self.projects_list.count()):
-            item = self.projects_list.item(i)
-            widget = self.projects_list.itemWidget(item)
-            if isinstance(widget, QCheckBox) and widget.isChecked():
-                project_name = widget.text()
+        for item in self._project_items:
+            if item.checkState() == Qt.CheckState.Checked:
+                project_name = item.data(PROJECT_NAME_ROLE)
                 path_str = item.data(Qt.ItemDataRole.UserRole)
                 try:
                     self.selected_projects.append((project_name, Path(path_str)))
@@ -199,6 +283,14 @@ class ProjectSelectionDialog(QDialog):
                     logging.error(f"Error converting path '{path_str}' to Path: {e}")
         
         if not self.selected_projects:
+            self._get_no_selection_msg().exec()
+            return
+        
+        super().accept()
+
+    def _get_no_selection_msg(self) -> QMessageBox:
+        """Returns the "no project selected" warning, creating and styling it on first use."""
+        if self._no_selection_msg is None:
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("No Project Selected")
             msg_box.setText("Select at least one project to install the extension.")
@@ -209,11 +301,8 @@ class ProjectSelectionDialog(QDialog):
             msg_box.setStyleSheet(DIALOG_STYLE)
             ok_button = msg_box.button(QMessageBox.StandardButton.Ok)
             ok_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
-            
-            msg_box.exec()
-            return
-        
-        super().accept()
+            self._no_selection_msg = msg_box
+        return self._no_selection_msg
 
     def get_selected_projects(self) -> List[Tuple[str, Path]]:
         """
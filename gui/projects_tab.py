@@ -1,14 +1,16 @@
 # -*- coding: utf-8 -*-
 # gui/projects_tab.py
 
+import functools
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable, List, Tuple
 
-from PyQt6.QtCore import QSize, Qt, QTimer, QUrl, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QTimer, QUrl, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QDesktopServices, QFont, QPixmap
 from PyQt6.QtWidgets import (
-    QApplication,
     QCheckBox,
     QComboBox,
     QDialog,
@@ -36,7 +38,8 @@ from project_handler import (
     install_extensions_logic,
     launch_project_editor,
     launch_project_run,
-    synchronize_projects_with_default_folder,
+    scan_default_projects_folder,
+    apply_projects_folder_scan,
     validate_godot_path,
     get_project_name_from_file,
     get_godot_executable_for_path,
@@ -55,6 +58,149 @@ from gui.styles import (  # Import of new styles
 from validators import is_valid_url # Usa import assoluto
 # from utils import cancel_process_tree # Rimosso, funzione non trovata/usata
 
+FOLDER_VALIDATION_DEBOUNCE_MS = 150 # Delay after the last keystroke before the projects folder is re-validated
+INVALID_PROJECT_TOOLTIP_SUFFIX = "\n(WARNING: Path missing or invalid!)"
+
+
+def _probe_project(path_str: str) -> Tuple[str, bool]:
+    """
+    Checks a registered project folder with a single stat of its project.godot.
+
+    A regular project.godot file implies that the folder exists, so one syscall answers
+    both questions.
+
+    Args:
+        path_str: The project folder path.
+
+    Returns:
+        A tuple (folder_name, is_valid).
+    """
+    folder_name = os.path.basename(os.path.normpath(path_str))
+    try:
+        st = os.stat(os.path.join(path_str, "project.godot"))
+    except OSError:
+        return folder_name, False
+    return folder_name, stat.S_ISREG(st.st_mode)
+
+
+@functools.lru_cache(maxsize=512)
+def _resolved(path_str: str) -> Path:
+    """
+    Resolves a stored project path, memoized per string (the cache is cleared on every
+    list refresh). Always resolve()s, like the import side, so symlinked parents match.
+    """
+    return Path(path_str).resolve()
+
+
+class ProjectProberSignals(QObject):
+    """Container for signals emitted by ProjectProber."""
+    probed = pyqtSignal(int, str, bool) # generation, project_name, is_valid
+
+
+class ProjectProber(QRunnable):
+    """A QRunnable task checking one registered project folder off the GUI thread."""
+    def __init__(self, generation: int, project_name: str, path_str: str):
+        """
+        Initializes the ProjectProber.
+
+        Args:
+            generation: List refresh this probe belongs to (echoed back so stale results can be ignored).
+            project_name: The registered project name.
+            path_str: The project folder path.
+        """
+        super().__init__()
+        self.generation = generation
+        self.project_name = project_name
+        self.path_str = path_str
+        self.signals = ProjectProberSignals()
+
+    def run(self):
+        """Probes the project folder and emits the result."""
+        try:
+            _folder_name, is_valid = _probe_project(self.path_str)
+        except Exception as e: # e.g. ValueError for paths with NUL characters
+            logging.error(f"Error probing project path '{self.path_str}': {e}")
+            is_valid = False
+        self.signals.probed.emit(self.generation, self.project_name, is_valid)
+
+
+class _ProjectStatusLabelProxy:
+    """
+    Label stand-in passed to install_extensions_logic during a multi-project install.
+
+    Prefixes each status message with the current project and forwards it to the real label.
+    Not a QWidget: only the methods install_extensions_logic calls are provided.
+    """
+    __slots__ = ("project_idx", "project_name", "total", "target")
+
+    def __init__(self, project_idx: int, project_name: str, total: int, target: QLabel):
+        self.project_idx = project_idx
+        self.project_name = project_name
+        self.total = total
+        self.target = target
+
+    def setText(self, text: str):
+        # Update the main status label with current project indication
+        self.target.setText(f"Project {self.project_idx+1}/{self.total} '{self.project_name}': {text}")
+
+
+class _ProjectProgressBarProxy:
+    """
+    Progress bar stand-in passed to install_extensions_logic during a multi-project install.
+
+    Maps the per-project percentage onto the overall bar; range and visibility of the real bar
+    stay under the tab's control.
+    """
+    __slots__ = ("project_idx", "total", "target")
+
+    def __init__(self, project_idx: int, total: int, target: QProgressBar):
+        self.project_idx = project_idx
+        self.total = total
+        self.target = target
+
+    def setValue(self, value: int):
+        if value >= 0:
+            # Calculate overall progress
+            project_portion = 100.0 / self.total
+            overall_percent = (self.project_idx * project_portion) + (value * project_portion / 100.0)
+            self.target.setValue(int(overall_percent))
+            self.target.setTextVisible(True)
+            self.target.setFormat(f"Project {self.project_idx+1}/{self.total}: {value}%")
+
+    def setRange(self, minimum: int, maximum: int):
+        pass # The overall bar keeps its 0-100 range
+
+    def setVisible(self, visible: bool):
+        pass # Shown/hidden by ProjectsTab for the whole operation
+
+
+class ProjectSyncThread(QThread):
+    """
+    A QThread scanning the default projects folder off the GUI thread.
+
+    Only the filesystem is touched here; the result is applied to DataManager on the GUI
+    thread (apply_projects_folder_scan), so the worker never mutates the shared project dict.
+
+    Signals:
+        sync_finished (object): Emitted when the scan is done with the result of
+                                scan_default_projects_folder(): (folder, {name: path_str}) or None.
+    """
+    sync_finished = pyqtSignal(object)
+
+    def __init__(self, default_folder_str: Optional[str]):
+        super().__init__()
+        self.default_folder_str = default_folder_str
+        self.setObjectName("ProjectSyncThread")
+
+    def run(self):
+        """Scans the default projects folder and emits the result."""
+        try:
+            scan_result = scan_default_projects_folder(self.default_folder_str)
+        except Exception:
+            logging.exception("Project folder scan failed.")
+            scan_result = None
+        self.sync_finished.emit(scan_result)
+
 
 class ProjectsTab(QWidget):
     """
@@ -74,9 +220,30 @@ class ProjectsTab(QWidget):
         """
         super().__init__()
         self.data_manager = data_manager # Store the DataManager instance
+        # Bound DataManager accessors used on refresh/selection paths (saves an attribute lookup per call)
+        self._get_projects = data_manager.get_projects
+        self._get_godot_path = data_manager.get_godot_path
+        self._get_auto_install_extensions = data_manager.get_auto_install_extensions
         self.current_project_path: Optional[Path] = None # Path of the currently selected project
         self.auto_installer_cancel_func: Optional[callable] = None # Function to cancel project creation/auto-install
         self.multi_install_cancel_func: Optional[callable] = None # Function to cancel multi-extension install
+        # Project list items by name and the current list generation (validity is probed in the background)
+        self._project_items: Dict[str, QListWidgetItem] = {}
+        self._invalid_projects: set[str] = set() # Names currently grayed out in the list
+        self._name_by_resolved_path: Dict[str, str] = {} # normcase(resolved project path) -> registered name
+        self._probe_generation = 0
+        # Selection-time validity results: path_str -> (project folder mtime, is_valid)
+        self._validity_cache: Dict[str, Tuple[float, bool]] = {}
+        # Godot executable check results: path_str -> (executable mtime, is_valid)
+        self._godot_path_cache: Dict[str, Tuple[float, bool]] = {}
+        self._sync_thread: Optional[ProjectSyncThread] = None # Folder synchronization thread, kept until its finished signal
+        self._sync_pending = False # True until the running scan's result has been applied (or discarded)
+        self._install_cancel_requested = False # Set by the cancel button until the running installation unwinds
+        # Debounce timer: folder path edits are validated once per typing burst, not per keystroke
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(FOLDER_VALIDATION_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self.validate_projects_folder_display)
         self.init_ui()
         self.refresh_project_list_display() # Initial population of the list
 
@@ -102,7 +269,7 @@ class ProjectsTab(QWidget):
         self.pfe = QLineEdit(self.data_manager.get_default_projects_folder() or "")
         self.pfe.setPlaceholderText("e.g., C:\\Users\\YourName\\GodotProjects")
         self.pfe.setStyleSheet(INPUT_STYLE)
-        self.pfe.textChanged.connect(self.validate_projects_folder_display)
+        self.pfe.textChanged.connect(self._validate_timer.start) # Restarts the debounce on each keystroke
         self.bpb = QPushButton("Browse...")
         self.bpb.setStyleSheet(BUTTON_STYLE)
         self.spb_save = QPushButton("Save Path")
@@ -160,6 +327,11 @@ class ProjectsTab(QWidget):
         rl.addWidget(self.ppl)
         rl.addSpacing(15)
 
+        # Container for everything disabled while the tab is busy (action buttons + install group)
+        self.right_panel_container = QWidget()
+        rcl = QVBoxLayout(self.right_panel_container) # right_container_layout
+        rcl.setContentsMargins(0, 0, 0, 0)
+
         # Selected Project Action Buttons (Launch, Open Folder, Remove)
         abl = QHBoxLayout() # action_button_layout
         self.lb = QPushButton("🚀 Launch Editor") # launch_button (renamed for clarity)
@@ -179,8 +351,8 @@ class ProjectsTab(QWidget):
         abl.addWidget(self.ofb)
         abl.addStretch()
         abl.addWidget(self.rmb)
-        rl.addLayout(abl)
-        rl.addSpacing(20)
+        rcl.addLayout(abl)
+        rcl.addSpacing(20)
 
         # Install Selected Extensions GroupBox
         self.isg = QGroupBox("Install Selected Extensions") # install_selected_groupbox
@@ -209,7 +381,8 @@ class ProjectsTab(QWidget):
         self.micb.setVisible(False)
         isl.addWidget(self.micb, 0, Qt.AlignmentFlag.AlignRight)
         self.isg.setEnabled(False) # Disabled initially
-        rl.addWidget(self.isg)
+        rcl.addWidget(self.isg)
+        rl.addWidget(self.right_panel_container)
         rl.addStretch() # Push elements to the top
         splitter.addWidget(rw)
 
@@ -275,8 +448,7 @@ class ProjectsTab(QWidget):
             is_valid = True # Empty is considered valid for saving (means 'unset')
         else:
             try:
-                p = Path(path_str)
-                if p.is_dir():
+                if os.path.isdir(path_str):
                     status_text = "<font color='green'>Valid.</font>"
                     style = "border: 1px solid green;"
                     is_valid = True
@@ -313,68 +485,222 @@ class ProjectsTab(QWidget):
             QMessageBox.warning(self, "Invalid Path", "The specified path is not valid.")
 
     def sync_and_refresh(self):
-        """Synchronizes the project list with the default folder and refreshes the display."""
+        """Synchronizes the project list with the default folder in a background thread, then refreshes the display."""
+        if self._sync_pending or self._sync_thread is not None:
+            logging.info("Project synchronization already running.")
+            return
         logging.info("Manual project synchronization requested...")
-        # Pass DataManager to the synchronization function
-        updated = synchronize_projects_with_default_folder(self.data_manager)
+        # Controls stay disabled until the scan result has been applied
+        self.set_controls_enabled(False)
+        self.sbf.setVisible(True)
+        self.sbl.setText("Synchronizing projects...")
+        self.sbp.setRange(0, 0) # Indeterminate progress
+        self.sbc.setVisible(False) # The folder scan cannot be cancelled
+        # The thread only scans; DataManager is updated in _on_sync_finished (GUI thread)
+        self._sync_pending = True
+        self._sync_thread = ProjectSyncThread(self.data_manager.get_default_projects_folder())
+        self._sync_thread.sync_finished.connect(self._on_sync_finished)
+        # sync_finished arrives before run() returns: the reference is only dropped once the thread has ended
+        self._sync_thread.finished.connect(self._on_sync_thread_finished)
+        self._sync_thread.finished.connect(self._sync_thread.deleteLater)
+        self._sync_thread.start()
+
+    @pyqtSlot()
+    def _on_sync_thread_finished(self):
+        """Releases the synchronization thread once it has actually stopped running."""
+        self._sync_thread = None
+
+    @pyqtSlot(object)
+    def _on_sync_finished(self, scan_result: Optional[Tuple[Path, Dict[str, str]]]):
+        """Applies the scan to DataManager, refreshes the list and restores the UI once the background scan is done."""
+        self._sync_pending = False
+        updated = False
+        if scan_result is not None:
+            try:
+                updated = apply_projects_folder_scan(self.data_manager, *scan_result)
+            except Exception:
+                logging.exception("Applying the project folder scan failed.")
         self.refresh_project_list_display() # Update the UI list
+        self.reset_creation_ui()
+        self.set_controls_enabled(True)
         msg = "Project list synchronized." + (
             " (No changes detected)" if not updated else ""
         )
         QMessageBox.information(self, "Synchronize", msg)
 
+    def is_sync_running(self) -> bool:
+        """Returns True while a background project folder scan has not been applied yet."""
+        return self._sync_pending
+
+    def wait_for_sync(self, timeout_ms: int = 5000) -> bool:
+        """
+        Waits for a running folder scan to end without applying its result (used on exit;
+        the scan itself cannot be interrupted).
+
+        Returns:
+            True if no scan is running anymore, False if the timeout expired.
+        """
+        thread = self._sync_thread
+        if thread is None:
+            return True
+        if self._sync_pending:
+            thread.sync_finished.disconnect(self._on_sync_finished)
+            self._sync_pending = False
+        if not thread.wait(timeout_ms):
+            return False # Still running: keep the reference so the QThread is not destroyed under it
+        self._sync_thread = None
+        return True
+
     def refresh_project_list_display(self):
-        """Clears and repopulates the project list widget based on DataManager data."""
+        """
+        Brings the project list widget in line with DataManager data.
+
+        Only entries that were added, removed or re-pathed are touched; unchanged items
+        (and the current selection) stay in place instead of rebuilding the whole list.
+        """
         logging.debug("Refreshing project list UI")
-        # Store selection before clearing
+        # Store selection path in case the selected entry gets replaced
         selected_item_path = None
         current_item = self.plw.currentItem()
         if current_item:
             selected_item_path = current_item.data(Qt.ItemDataRole.UserRole)
 
-        self.plw.clear()
+        self._validity_cache.clear() # Every add/remove/sync ends up here, so cached results start fresh
+        _resolved.cache_clear()
+        self._probe_generation += 1 # Results of probes from earlier refreshes are ignored
         # Use DataManager to get the current projects
-        projects = self.data_manager.get_projects()
-
-        if not projects:
-            item = QListWidgetItem("No registered projects.")
-            item.setFlags(Qt.ItemFlag.NoItemFlags) # Make it unselectable
-            self.plw.addItem(item)
-        else:
-            # Sort projects by name for consistent display
-            for project_name, path_str in sorted(projects.items()):
-                item = QListWidgetItem(project_name)
-                item.setData(Qt.ItemDataRole.UserRole, path_str) # Store path in item data
-                tooltip_text = f"Name: {project_name}\nPath: {path_str}"
-                try:
-                    proj_path = Path(path_str)
-                    folder_name = proj_path.name
-                    tooltip_text += f"\nFolder: {folder_name}"
-                    # Check if project path is valid and exists
-                    if (
-                        not proj_path.exists()
-                        or not (proj_path / "project.godot").is_file()
-                    ):
-                        item.setForeground(Qt.GlobalColor.gray) # Gray out invalid entries
-                        tooltip_text += "\n(WARNING: Path missing or invalid!)"
-                except Exception as e: # Catch errors resolving path
-                    item.setForeground(Qt.GlobalColor.red)
-                    tooltip_text += f"\n(ERROR: Invalid path - {e})"
-
-                item.setToolTip(tooltip_text)
-                self.plw.addItem(item)
-                # Restore selection if this item was previously selected
-                if path_str == selected_item_path:
-                    self.plw.setCurrentItem(item)
-
-        # If no item is selected after refresh (e.g., previous selection was removed), select the first one if list is not empty
-        if not self.plw.currentItem() and self.plw.count() > 0 and self.plw.item(0).flags() != Qt.ItemFlag.NoItemFlags:
-            self.plw.setCurrentRow(0)
+        projects = self._get_projects()
+        # Enum lookups hoisted out of the loop
+        user_role = Qt.ItemDataRole.UserRole
+        no_item_flags = Qt.ItemFlag.NoItemFlags
+        plw = self.plw
+        project_items = self._project_items
+        start_probe = QThreadPool.globalInstance().start
+
+        # No repaint or selection signal per row; the right panel is updated once below
+        plw.setUpdatesEnabled(False)
+        plw.blockSignals(True)
+        try:
+            if not projects:
+                plw.clear()
+                project_items.clear()
+                self._invalid_projects.clear()
+                item = QListWidgetItem("No registered projects.")
+                item.setFlags(no_item_flags) # Make it unselectable
+                plw.addItem(item)
+            else:
+                if not project_items:
+                    plw.clear() # Drop the "No registered projects." placeholder
+                # Remove entries that disappeared or now point to a different folder
+                for project_name, item in list(project_items.items()):
+                    if projects.get(project_name) != item.data(user_role):
+                        plw.takeItem(plw.row(item))
+                        del project_items[project_name]
+                        self._invalid_projects.discard(project_name)
+                # Insert new entries at their sorted position; existing ones are already in order
+                for row, (project_name, path_str) in enumerate(sorted(projects.items())):
+                    if project_name not in project_items:
+                        item = QListWidgetItem(project_name)
+                        item.setData(user_role, path_str) # Store path in item data
+                        folder_name = os.path.basename(os.path.normpath(path_str))
+                        item.setToolTip(f"Name: {project_name}\nPath: {path_str}\nFolder: {folder_name}")
+                        plw.insertItem(row, item)
+                        project_items[project_name] = item
+                        # Restore selection if this item replaced the previously selected one
+                        if path_str == selected_item_path and not plw.currentItem():
+                            plw.setCurrentItem(item)
+                    # Re-check every folder in the background; the result grays out or restores the entry
+                    prober = ProjectProber(self._probe_generation, project_name, path_str)
+                    prober.signals.probed.connect(self._on_project_probed)
+                    start_probe(prober)
+
+            # If no item is selected after refresh (e.g., previous selection was removed), select the first one if list is not empty
+            if not plw.currentItem() and plw.count() > 0 and plw.item(0).flags() != no_item_flags:
+                plw.setCurrentRow(0)
+        finally:
+            plw.blockSignals(False)
+            plw.setUpdatesEnabled(True)
+        self._rebuild_path_index(projects)
 
         # Update the right panel based on the current selection (or lack thereof)
         self.on_project_selection_changed()
         self.project_list_changed.emit() # Notify other parts of the app
 
+    @pyqtSlot(int, str, bool)
+    def _on_project_probed(self, generation: int, project_name: str, is_valid: bool):
+        """Grays out a project entry whose folder is missing or invalid, or restores it once fixed."""
+        if generation != self._probe_generation or is_valid == (project_name not in self._invalid_projects):
+            return # Stale result or nothing changed
+        item = self._project_items.get(project_name)
+        if item is None:
+            return
+        if is_valid:
+            self._invalid_projects.discard(project_name)
+            item.setData(Qt.ItemDataRole.ForegroundRole, None) # Back to the default color
+            item.setToolTip(item.toolTip().removesuffix(INVALID_PROJECT_TOOLTIP_SUFFIX))
+        else:
+            self._invalid_projects.add(project_name)
+            item.setForeground(Qt.GlobalColor.gray) # Gray out invalid entries
+            item.setToolTip(item.toolTip() + INVALID_PROJECT_TOOLTIP_SUFFIX)
+
+    def _rebuild_path_index(self, projects: Dict[str, str]):
+        """Rebuilds the resolved path -> name index used by the import duplicate check."""
+        index: Dict[str, str] = {}
+        for name, path_str in projects.items():
+            try:
+                # normcase: on Windows the same folder may be stored with different letter case
+                index.setdefault(os.path.normcase(str(_resolved(path_str))), name) # First registration wins, like the old scan
+            except Exception:
+                pass # Ignore errors resolving potentially invalid stored paths
+        self._name_by_resolved_path = index
+
+    def _select_project_item(self, project_name: str) -> Optional[QListWidgetItem]:
+        """Selects the list entry for project_name via the name -> item map; returns it, or None if not listed."""
+        item = self._project_items.get(project_name)
+        if item is not None:
+            self.plw.setCurrentItem(item)
+        return item
+
+    def _is_valid_project(self, path_str: str) -> bool:
+        """
+        Returns whether path_str is a Godot project folder, reusing the cached result
+        while the folder's mtime is unchanged.
+
+        Adding or removing project.godot updates the folder mtime, so a hit costs a single
+        stat of the folder instead of re-checking the folder and its project file.
+        """
+        try:
+            folder_mtime = os.stat(path_str).st_mtime
+        except (OSError, ValueError):
+            self._validity_cache.pop(path_str, None)
+            return False
+        cached = self._validity_cache.get(path_str)
+        if cached is not None and cached[0] == folder_mtime:
+            return cached[1]
+        _folder_name, is_valid = _probe_project(path_str)
+        self._validity_cache[path_str] = (folder_mtime, is_valid)
+        return is_valid
+
+    def _is_godot_path_valid(self, godot_path: str) -> bool:
+        """
+        Returns whether godot_path is a usable Godot executable, reusing the cached result
+        while the file's mtime is unchanged.
+
+        validate_godot_path also runs the executable to read its version, so repeated
+        launch/run clicks would otherwise spawn a process each time.
+        """
+        try:
+            mtime = os.stat(godot_path).st_mtime
+        except (OSError, ValueError):
+            self._godot_path_cache.pop(godot_path, None)
+            return False
+        cached = self._godot_path_cache.get(godot_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        is_valid, _version = validate_godot_path(godot_path)
+        self._godot_path_cache[godot_path] = (mtime, is_valid)
+        return is_valid
+
     def on_project_selection_changed(self):
         """Updates the right panel details based on the selected project in the list."""
         current_item = self.plw.currentItem()
@@ -390,14 +716,13 @@ class ProjectsTab(QWidget):
 
             if path_str:
                 try:
-                    proj_path = Path(path_str)
-                    folder_name = proj_path.name
+                    folder_name = os.path.basename(os.path.normpath(path_str))
                     # Display path and folder name
                     self.ppl.setText(f"📍 {path_str}\n   (Folder: {folder_name})")
                     # Check if the project path is valid
-                    if proj_path.is_dir() and (proj_path / "project.godot").is_file():
+                    if self._is_valid_project(path_str):
                         project_is_valid_and_exists = True
-                        self.current_project_path = proj_path # Store valid path
+                        self.current_project_path = Path(path_str) # Store valid path
                     else:
                         # Indicate invalid path
                         self.ppl.setText(
@@ -468,18 +793,25 @@ class ProjectsTab(QWidget):
         self.sbc.setVisible(True)
         self.sbc.setEnabled(False) # Cannot cancel structure creation itself easily
         self.auto_installer_cancel_func = None # Reset cancel function
-        QApplication.processEvents()
 
         # Get Godot path from DataManager
-        active_godot_path = self.data_manager.get_godot_path()
+        active_godot_path = self._get_godot_path()
         # Validate Godot path before proceeding (needed for version detection in create_project_structure)
-        if not active_godot_path or not validate_godot_path(active_godot_path):
+        if not active_godot_path or not self._is_godot_path_valid(active_godot_path):
              logging.warning("Cannot create project: Default Godot path is not set or invalid.")
              QMessageBox.warning(self, "Error", "Default Godot path is not set or invalid.\nPlease set it in the Settings tab.")
              self.reset_creation_ui()
              self.set_controls_enabled(True) # Re-enable controls after error
              return
 
+        # Yield to the event loop once so the status frame is painted before the blocking structure creation
+        QTimer.singleShot(0, lambda: self._continue_project_creation(
+            project_path, project_name, renderer, active_godot_path, include_extensions, edit_now
+        ))
+
+    def _continue_project_creation(self, project_path: Path, project_name: str, renderer: str,
+                                   active_godot_path: str, include_extensions: bool, edit_now: bool):
+        """Creates the project structure and starts the optional auto-install (second half of start_project_creation)."""
         # Create the basic project structure
         if not create_project_structure(project_path, project_name, active_godot_path, renderer):
             # Error message is shown by create_project_structure
@@ -490,24 +822,21 @@ class ProjectsTab(QWidget):
         # Add project to list and update UI (using DataManager)
         self.sbl.setText("Project structure created.")
         self.sbp.setValue(10)
-        QApplication.processEvents()
         self.data_manager.add_project(project_name, str(project_path))
         self.refresh_project_list_display()
         # Select the newly created project in the list
-        items = self.plw.findItems(project_name, Qt.MatchFlag.MatchExactly)
-        if items: self.plw.setCurrentItem(items[0])
+        self._select_project_item(project_name)
         self.current_project_path = project_path # Update current path
 
         # Auto-install extensions (using DataManager to get IDs)
         # Check the include_extensions flag passed from the dialog
         if include_extensions:
-            auto_install_ids = self.data_manager.get_auto_install_extensions()
+            auto_install_ids = self._get_auto_install_extensions()
             if auto_install_ids:
                 logging.info(f"Starting auto-installation for {len(auto_install_ids)} extensions.")
                 self.sbl.setText(f"Installing {len(auto_install_ids)} auto-selected extensions...")
                 self.sbp.setValue(15)
                 self.sbc.setEnabled(True) # Allow cancelling the auto-install part
-                QApplication.processEvents()
 
                 # Define callbacks for the installation logic
                 def progress_callback(percent: int):
@@ -593,25 +922,21 @@ class ProjectsTab(QWidget):
         """Enables or disables the main controls in the Projects tab."""
         logging.debug(f"Setting ProjectsTab controls enabled={enabled}")
         # Left panel controls
+        folder_valid = self.validate_projects_folder_display() # Validate once, reused for both buttons
+        has_folder_text = bool(self.pfe.text().strip())
         self.plw.setEnabled(enabled)
         self.npb.setEnabled(enabled)
         self.ipb.setEnabled(enabled)
-        self.spb_sync.setEnabled(enabled and self.validate_projects_folder_display() and bool(self.pfe.text().strip())) # Sync only if path valid
+        self.spb_sync.setEnabled(enabled and folder_valid and has_folder_text) # Sync only if path valid
         self.pfe.setEnabled(enabled)
         self.bpb.setEnabled(enabled)
-        self.spb_save.setEnabled(enabled and self.validate_projects_folder_display()) # Save only if path valid/empty
+        self.spb_save.setEnabled(enabled and folder_valid) # Save only if path valid/empty
 
-        # Right panel controls are handled by on_project_selection_changed based on list state
+        # Right panel: one setEnabled on the container disables all its children in a single pass;
+        # when enabled, the individual states are handled by on_project_selection_changed based on list state
+        self.right_panel_container.setEnabled(enabled)
         if enabled:
             self.on_project_selection_changed()
-        else:
-            # Explicitly disable right panel buttons when overall controls are disabled
-            self.lb.setEnabled(False)
-            self.rb.setEnabled(False)
-            self.ofb.setEnabled(False)
-            self.rmb.setEnabled(False)
-            self.isg.setEnabled(False)
-            self.isb.setEnabled(False)
 
 
     def cancel_project_creation_or_auto_install(self):
@@ -655,19 +980,12 @@ class ProjectsTab(QWidget):
             QMessageBox.warning(self, "Import Error", f"Could not read project name from 'project.godot' in the selected folder:\n{path}")
             return
 
-        path_str = str(path.resolve())
+        path_str = str(path.resolve()) # Same normalization as _resolved(), so it matches the path index keys
         # Use DataManager to get existing projects
-        stored_projects = self.data_manager.get_projects()
+        stored_projects = self._get_projects()
 
-        # Check if this exact path is already registered
-        existing_name_for_path = None
-        for name, stored_path_str in stored_projects.items():
-            try:
-                if Path(stored_path_str).resolve() == path.resolve():
-                    existing_name_for_path = name
-                    break
-            except Exception:
-                pass # Ignore errors resolving potentially invalid stored paths
+        # Check if this exact path is already registered (index kept up to date by refresh_project_list_display)
+        existing_name_for_path = self._name_by_resolved_path.get(os.path.normcase(path_str))
 
         if existing_name_for_path:
             # Path is already registered
@@ -698,8 +1016,7 @@ class ProjectsTab(QWidget):
                     logging.info("Name update cancelled by user.")
                     return # Do nothing further
             # Select the existing/updated item
-            items = self.plw.findItems(project_name, Qt.MatchFlag.MatchExactly)
-            if items: self.plw.setCurrentItem(items[0])
+            self._select_project_item(project_name)
             return # End import process
 
         # Path is not registered, check if the name is already used by another path
@@ -723,8 +1040,7 @@ class ProjectsTab(QWidget):
         self.refresh_project_list_display()
         QMessageBox.information(self, "Project Imported", f"Project '{project_name}' was successfully added/updated.")
         # Select the newly added item
-        items = self.plw.findItems(project_name, Qt.MatchFlag.MatchExactly)
-        if items: self.plw.setCurrentItem(items[0])
+        self._select_project_item(project_name)
 
     def launch_selected_project(self):
         """Launches the Godot editor for the currently selected project."""
@@ -734,8 +1050,8 @@ class ProjectsTab(QWidget):
             return
 
         # Get Godot path from DataManager
-        godot_path = self.data_manager.get_godot_path()
-        if not godot_path or not validate_godot_path(godot_path):
+        godot_path = self._get_godot_path()
+        if not godot_path or not self._is_godot_path_valid(godot_path):
             logging.error("Cannot launch project: Default Godot path is missing or invalid.")
             QMessageBox.critical(self, "Launch Error", "The default Godot executable path is missing or invalid.\nPlease set it in the Settings tab.")
             return
@@ -751,8 +1067,8 @@ class ProjectsTab(QWidget):
             return
 
         # Get Godot path from DataManager
-        godot_path = self.data_manager.get_godot_path()
-        if not godot_path or not validate_godot_path(godot_path):
+        godot_path = self._get_godot_path()
+        if not godot_path or not self._is_godot_path_valid(godot_path):
             logging.error("Cannot run project: Default Godot path is missing or invalid.")
             QMessageBox.critical(self, "Run Error", "The default Godot executable path is missing or invalid.\nPlease set it in the Settings tab.")
             return
@@ -826,7 +1142,9 @@ class ProjectsTab(QWidget):
         #       in the Extensions tab, not the auto-install list. This needs clarification
         #       or renaming/repurposing of the button/logic.
         #       Assuming for now it *should* use the auto-install list based on current code.
-        extension_ids = self.data_manager.get_auto_install_extensions()
+        # Snapshot once: the list cannot change while the confirmation dialog is open
+        extension_ids = tuple(self._get_auto_install_extensions())
+        extension_count = len(extension_ids)
 
         if not extension_ids:
             logging.info("No extensions marked for auto-install (or selected).")
@@ -844,12 +1162,12 @@ class ProjectsTab(QWidget):
             return
 
         project_name = self.pnl.text() # Get current project name from label
-        logging.info(f"Requesting installation of {len(extension_ids)} extensions into project '{project_name}'")
+        logging.info(f"Requesting installation of {extension_count} extensions into project '{project_name}'")
 
         reply = QMessageBox.question(
             self,
             "Confirm Installation",
-            f"Install {len(extension_ids)} selected extensions into '{project_name}'?\n\n"
+            f"Install {extension_count} selected extensions into '{project_name}'?\n\n"
             f"(Existing addons with the same name might be overwritten)",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
             QMessageBox.StandardButton.Yes,
@@ -859,14 +1177,7 @@ class ProjectsTab(QWidget):
             return
 
         # --- Setup UI for Installation ---
-        self.set_controls_enabled(False) # Disable main controls
-        self.isb.setEnabled(False) # Disable the install button itself
-        self.misl.setVisible(True)
-        self.misl.setText("Starting installation...")
-        self.mipb.setVisible(True)
-        self.micb.setVisible(True)
-        self.micb.setEnabled(True)
-        QApplication.processEvents() # Update UI
+        self._show_install_progress_ui("Starting installation...")
 
         # --- Define Finished Callback ---
         def finished_callback(success: bool, message: str):
@@ -895,13 +1206,16 @@ class ProjectsTab(QWidget):
             logging.info("install_extensions_logic returned None (no valid extensions?).")
             finished_callback(True, "No valid extensions to install.")
 
-    def start_single_extension_installation(self, asset_id: int):
+    def start_single_extension_installation(self, asset_id: int, extension_name: Optional[str] = None):
         """
         Starts the installation process for a single extension identified by asset_id.
         
         Args:
             asset_id: The ID of the extension to install
+            extension_name: Title of the extension as shown to the user (defaults to "Extension #<id>")
         """
+        if extension_name is None:
+            extension_name = f"Extension #{asset_id}" # Titles are looked up by MainWindow, not here
         if not self.current_project_path:
             logging.warning(f"Attempt to install extension {asset_id} without a valid project.")
             QMessageBox.warning(self, "Error", "Please select a valid project first.")
@@ -920,14 +1234,6 @@ class ProjectsTab(QWidget):
         # Get the project name from the UI
         project_name = self.pnl.text()
         
-        # Fetch extension details to get the name
-        try:
-            from api_clients import fetch_asset_details_sync
-            extension_details = fetch_asset_details_sync(asset_id)
-            extension_name = extension_details.get('title', f"Extension #{asset_id}")
-        except Exception as e:
-            logging.error(f"Failed to fetch details for extension {asset_id}: {e}")
-            extension_name = f"Extension #{asset_id}"
         
         logging.info(f"Requesting installation of extension '{extension_name}' (ID: {asset_id}) into project '{project_name}'")
 
@@ -945,14 +1251,7 @@ class ProjectsTab(QWidget):
             return
 
         # --- Setup UI for Installation ---
-        self.set_controls_enabled(False) # Disable main controls
-        self.isb.setEnabled(False) # Disable the install button itself
-        self.misl.setVisible(True)
-        self.misl.setText("Starting installation...")
-        self.mipb.setVisible(True)
-        self.micb.setVisible(True)
-        self.micb.setEnabled(True)
-        QApplication.processEvents() # Update UI
+        self._show_install_progress_ui("Starting installation...")
 
         # --- Define Finished Callback ---
         def finished_callback(success: bool, message: str):
@@ -981,14 +1280,18 @@ class ProjectsTab(QWidget):
             logging.info(f"install_extensions_logic returned None for project '{project_name}'")
             finished_callback(False, f"Could not install extension: invalid ID ({asset_id}).")
             
-    def start_multi_project_extension_installation(self, asset_id: int, projects: List[Tuple[str, Path]]):
+    def start_multi_project_extension_installation(self, asset_id: int, projects: List[Tuple[str, Path]],
+                                                   extension_name: Optional[str] = None):
         """
         Starts the process of installing an extension across multiple projects.
         
         Args:
             asset_id: ID of the extension to install
             projects: List of tuples (project_name, path) of projects where to install the extension
+            extension_name: Title of the extension as shown to the user (defaults to "Extension #<id>")
         """
+        if extension_name is None:
+            extension_name = f"Extension #{asset_id}" # Titles are looked up by MainWindow, not here
         if not projects:
             logging.warning(f"Attempt to install extension {asset_id} without any projects.")
             QMessageBox.warning(self, "Error", "No project selected for installation.")
@@ -1004,14 +1307,6 @@ class ProjectsTab(QWidget):
             QMessageBox.warning(self, "Busy", "Project creation/auto-installation is currently in progress.")
             return
             
-        # Fetch extension details to get the name
-        try:
-            from api_clients import fetch_asset_details_sync
-            extension_details = fetch_asset_details_sync(asset_id)
-            extension_name = extension_details.get('title', f"Extension #{asset_id}")
-        except Exception as e:
-            logging.error(f"Failed to fetch details for extension {asset_id}: {e}")
-            extension_name = f"Extension #{asset_id}"
             
         project_names = [name for name, _ in projects]
         projects_str = ", ".join(project_names)
@@ -1019,15 +1314,7 @@ class ProjectsTab(QWidget):
         logging.info(f"Requesting installation of extension '{extension_name}' (ID: {asset_id}) into {len(projects)} projects: {projects_str}")
         
         # --- Setup UI for Installation ---
-        self.set_controls_enabled(False)  # Disable main controls
-        self.isb.setEnabled(False)  # Disable the install button itself
-        self.misl.setVisible(True)
-        self.misl.setText(f"Preparing installation of '{extension_name}' in {len(projects)} projects...")
-        self.mipb.setVisible(True)
-        self.mipb.setValue(0)
-        self.micb.setVisible(True)
-        self.micb.setEnabled(True)
-        QApplication.processEvents()  # Update UI
+        self._show_install_progress_ui(f"Preparing installation of '{extension_name}' in {len(projects)} projects...")
         
         # Variables to track installation status
         remaining_projects = projects.copy()
@@ -1071,63 +1358,35 @@ class ProjectsTab(QWidget):
             else:
                 logging.error(f"Extension installation failed in project '{project_name}': {message}")
                 failed_projects.append((project_name, message))
+
+            # After a cancel request the remaining projects are skipped
+            if self._install_cancel_requested and remaining_projects:
+                failed_projects.extend((name, "Cancelled.") for name, _ in remaining_projects)
+                remaining_projects.clear()
                 
             # If there are more projects to process, continue with the next one
             if remaining_projects:
                 current_project_idx += 1
                 self.mipb.setValue(int((current_project_idx / total_projects) * 100))
-                QApplication.processEvents()
                 
-                # Start installation for the next project
+                # Start installation for the next project once control is back in the event loop
+                # (lets Qt repaint between projects without re-entering it from this callback)
                 next_project = remaining_projects[0]
-                process_next_project(next_project[1])
+                QTimer.singleShot(0, lambda: process_next_project(next_project[1]))
             else:
                 # All projects have been processed, show summary
                 show_final_results()
         
-        # --- Wrapper class to adapt widgets to callback functions ---
-        class StatusLabelAdapter(QLabel):
-            def __init__(self, parent, project_idx, project_name, total, callback_label):
-                super().__init__(parent)
-                self.project_idx = project_idx
-                self.project_name = project_name
-                self.total = total
-                self.callback_label = callback_label
-                
-            def setText(self, text):
-                # Update the main status label with current project indication
-                prefix = f"Project {self.project_idx+1}/{self.total} '{self.project_name}': "
-                self.callback_label.setText(prefix + text)
-                QApplication.processEvents()
-        
-        class ProgressBarAdapter(QProgressBar):
-            def __init__(self, parent, project_idx, total, callback_progress):
-                super().__init__(parent)
-                self.project_idx = project_idx
-                self.total = total
-                self.callback_progress = callback_progress
-                
-            def setValue(self, value):
-                if value >= 0:
-                    # Calculate overall progress
-                    project_portion = 100.0 / self.total
-                    overall_percent = (self.project_idx * project_portion) + (value * project_portion / 100.0)
-                    self.callback_progress.setValue(int(overall_percent))
-                    self.callback_progress.setTextVisible(True)
-                    self.callback_progress.setFormat(f"Project {self.project_idx+1}/{self.total}: {value}%")
-                    QApplication.processEvents()
-        
         # --- Function to start installation in the next project ---
         def process_next_project(project_path: Path):
             # Update UI for the new project
             project_name = projects[current_project_idx][0]
             self.misl.setText(f"Installing in '{project_name}' ({current_project_idx+1}/{total_projects})...")
             self.mipb.setValue(int((current_project_idx / total_projects) * 100))
-            QApplication.processEvents()
             
-            # Create widget adapters
-            status_adapter = StatusLabelAdapter(self, current_project_idx, project_name, total_projects, self.misl)
-            progress_adapter = ProgressBarAdapter(self, current_project_idx, total_projects, self.mipb)
+            # Create lightweight proxies forwarding to the shared label/progress bar
+            status_adapter = _ProjectStatusLabelProxy(current_project_idx, project_name, total_projects, self.misl)
+            progress_adapter = _ProjectProgressBarProxy(current_project_idx, total_projects, self.mipb)
             
             # Start installation for this project
             self.multi_install_cancel_func = install_extensions_logic(
@@ -1151,7 +1410,6 @@ class ProjectsTab(QWidget):
             self.misl.setText("Preparing installation...")
             self.mipb.setValue(0)
             self.mipb.setFormat("")
-            QApplication.processEvents()
             
             # Start with the first project
             process_next_project(remaining_projects[0][1])
@@ -1163,22 +1421,14 @@ class ProjectsTab(QWidget):
     
     def remove_multi_install_dialog(self, success: bool = True, message: str = ""):
         """Removes the multi-installation dialog and restores normal UI."""
-        # Remove multi-install components
-        if hasattr(self, 'misl'):
-            self.misl.deleteLater()
-            delattr(self, 'misl')
-        
-        if hasattr(self, 'mipb'):
-            self.mipb.deleteLater()
-            delattr(self, 'mipb')
-        
-        if hasattr(self, 'micb'):
-            self.micb.deleteLater()
-            delattr(self, 'micb')
-        
-        if hasattr(self, 'miw'):
-            self.miw.deleteLater()
-            delattr(self, 'miw')
+        # Remove multi-install components (one layout pass for all of them)
+        self.setUpdatesEnabled(False)
+        for attr in ('misl', 'mipb', 'micb', 'miw'):
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                widget.deleteLater()
+                delattr(self, attr)
+        self.setUpdatesEnabled(True)
         
         # Reset the asset list selection
         if success:
@@ -1199,18 +1449,48 @@ class ProjectsTab(QWidget):
                 QMessageBox.warning(self, "Installation Failed", message)
 
     def cancel_selected_extensions_installation(self):
-        """Cancels the current installation of extensions if running."""
+        """
+        Requests cancellation of the running extension installation.
+
+        Cancellation is cooperative: the installer (and its download thread) stop at their next
+        check, between download chunks or installation steps, and the installation's finished
+        callback then resets the UI on the GUI thread.
+        """
+        if self.multi_install_cancel_func is None:
+            logging.warning("No selected extensions installation process is currently running to be cancelled.")
+            return
+        if self._install_cancel_requested:
+            return # Already cancelling
+        logging.info("Cancelling extension installation...")
+        self._install_cancel_requested = True
+        self.micb.setEnabled(False) # Disable cancel button while the installer unwinds
+        self.misl.setText("Cancelling...")
         try:
-            if self.installer_thread and self.installer_thread.isRunning():
-                logging.info("Cancelling extension installation thread...")
-                self.installer_thread.terminate()
-                self._reset_multi_install_ui()
-                self.status_message.emit("Installation cancelled.", 3000)
-            else:
-                logging.warning("No selected extensions installation process is currently running to be cancelled.")
+            self.multi_install_cancel_func()
         except Exception as e:
             logging.exception(f"Error cancelling extension installation: {e}")
             self._reset_multi_install_ui()
+            return
+        self.status_message.emit("Cancelling installation...", 3000)
+
+    def _show_install_progress_ui(self, status_text: str):
+        """Disables the tab controls and shows the extension install status widgets (counterpart of _reset_multi_install_ui)."""
+        self.set_controls_enabled(False) # Disable main controls (includes the install button itself)
+        self._install_cancel_requested = False
+        # Batch the visibility/text changes into a single repaint; Qt paints when control returns to the event loop
+        self.setUpdatesEnabled(False)
+        # The Cancel button lives in the install group: keep that path enabled, with the other actions off
+        for widget in (self.lb, self.rb, self.ofb, self.rmb, self.isb):
+            widget.setEnabled(False)
+        self.isg.setEnabled(True)
+        self.right_panel_container.setEnabled(True)
+        self.misl.setVisible(True)
+        self.misl.setText(status_text)
+        self.mipb.setVisible(True)
+        self.mipb.setValue(0)
+        self.micb.setVisible(True)
+        self.micb.setEnabled(True)
+        self.setUpdatesEnabled(True)
 
     def _reset_multi_install_ui(self):
         """Restores the UI elements used to display multi-extension installation progress."""
@@ -1225,14 +1505,22 @@ class ProjectsTab(QWidget):
         self.set_controls_enabled(True) # Re-enable main controls
         # Re-enable the install button based on current state (managed by set_controls_enabled -> on_project_selection_changed)
 
-    def add_and_select_project(self, name: str, path_str: str):
-        """Aggiunge un progetto utilizzando DataManager e lo seleziona nella lista."""
+    def add_and_select_project(self, name: str, path_str: str, skip_data_manager_add: bool = False):
+        """
+        Aggiunge un progetto utilizzando DataManager e lo seleziona nella lista.
+
+        Args:
+            name: Nome del progetto.
+            path_str: Percorso del progetto.
+            skip_data_manager_add: True se il chiamante ha già aggiunto il progetto al DataManager
+                                   (evita una seconda aggiunta e un secondo salvataggio).
+        """
         logging.info(f"ProjectsTab: Aggiunta del progetto '{name}' in '{path_str}' e selezione.")
         # Usa DataManager per aggiungere il progetto
-        self.data_manager.add_project(name, path_str)
+        if not skip_data_manager_add:
+            self.data_manager.add_project(name, path_str)
         self.refresh_project_list_display() # Aggiorna la lista
         # Trova e seleziona l'elemento appena aggiunto
-        items = self.plw.findItems(name, Qt.MatchFlag.MatchExactly)
-        if items:
-            self.plw.setCurrentItem(items[0])
-            self.plw.scrollToItem(items[0]) # Assicura che sia visibile
+        item = self._select_project_item(name)
+        if item is not None:
+            self.plw.scrollToItem(item) # Assicura che sia visibile
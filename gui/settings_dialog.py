@@ -55,8 +55,8 @@ class SettingsDialog(QDialog):
     Dialog window for configuring launcher settings, including the default Godot executable path,
     the location for downloaded Godot versions, and downloading new Godot versions.
     """
-    # Signal emitted when the default Godot path is changed and saved
-    godot_path_changed = pyqtSignal()
+    # Signal emitted when the default Godot path is changed and saved (new path, "" if cleared)
+    godot_path_changed = pyqtSignal(str)
     # Signal emitted when theme settings are changed
     theme_changed = pyqtSignal(str, bool)  # theme_name, use_accent_color
     # Removed unused godot_versions_path_changed signal
@@ -528,6 +528,7 @@ class SettingsDialog(QDialog):
             self.data_manager._data["sync_projects_startup"] = self.sync_projects_startup.isChecked()
             
             # Salva il percorso Godot (prelevando il valore dalla combo box se disponibile)
+            previous_godot_path = self.data_manager.get_godot_path()
             selected_index = self.installed_versions_combo.currentIndex()
             if selected_index >= 0:
                 selected_path = self.installed_versions_combo.itemData(selected_index)
@@ -543,6 +544,11 @@ class SettingsDialog(QDialog):
                 if godot_path:
                     self.data_manager.set_godot_path(godot_path)
             
+            # Notifica il nuovo percorso (evita una nuova lettura dal DataManager nel ricevente)
+            new_godot_path = self.data_manager.get_godot_path()
+            if new_godot_path != previous_godot_path:
+                self.godot_path_changed.emit(new_godot_path or "")
+            
             # Salva il percorso di download delle versioni (unificato)
             versions_download_path = self.versions_download_edit.text().strip()
             if versions_download_path:
@@ -560,7 +566,7 @@ class SettingsDialog(QDialog):
             self.data_manager._data["verbose_logging"] = self.verbose_logging_checkbox.isChecked()
             
             # Salva le modifiche al file JSON
-            self.data_manager.save_data()
+            self.data_manager.request_save() # Coalesced with the setter saves above
             
             # Chiudi la finestra di dialogo
             super().accept()
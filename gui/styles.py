@@ -36,10 +36,6 @@ from gui.styles.main import MAIN_STYLE
 from gui.styles.components import (
     STATUS_STYLE,
     PAGINATION_STYLE,
-    ASSET_TITLE_STYLE,
-    ASSET_INFO_STYLE,
-    COPY_BUTTON_STYLE,
-    ICON_PLACEHOLDER_STYLE,
     CANCEL_BUTTON_STYLE
 )
 
@@ -66,9 +62,5 @@ __all__ = [
     # Specific components
     'STATUS_STYLE',
     'PAGINATION_STYLE',
-    'ASSET_TITLE_STYLE',
-    'ASSET_INFO_STYLE',
-    'COPY_BUTTON_STYLE',
-    'ICON_PLACEHOLDER_STYLE',
     'CANCEL_BUTTON_STYLE'
 ] 
\ No newline at end of file
@@ -21,6 +21,7 @@ from .inputs import (
 from .containers import (
     GROUP_BOX_STYLE,
     LIST_WIDGET_STYLE,
+    CHECKABLE_LIST_WIDGET_STYLE,
     FRAME_STYLE,
     DIALOG_STYLE
 )
@@ -36,10 +37,7 @@ from .main import MAIN_STYLE
 from .components import (
     STATUS_STYLE,
     PAGINATION_STYLE,
-    ASSET_TITLE_STYLE,
-    ASSET_INFO_STYLE,
-    COPY_BUTTON_STYLE,
-    ICON_PLACEHOLDER_STYLE,
+    ASSET_RESULTS_STYLE,
     CANCEL_BUTTON_STYLE
 )
 
@@ -57,6 +55,7 @@ __all__ = [
     'INPUT_INVALID_STYLE',
     'GROUP_BOX_STYLE',
     'LIST_WIDGET_STYLE',
+    'CHECKABLE_LIST_WIDGET_STYLE',
     'PROGRESS_BAR_STYLE',
     'SPLITTER_STYLE',
     'FRAME_STYLE',
@@ -65,10 +64,7 @@ __all__ = [
     'DIALOG_STYLE',
     'STATUS_STYLE',
     'PAGINATION_STYLE',
-    'ASSET_TITLE_STYLE',
-    'ASSET_INFO_STYLE',
-    'COPY_BUTTON_STYLE',
-    'ICON_PLACEHOLDER_STYLE',
+    'ASSET_RESULTS_STYLE',
     'CANCEL_BUTTON_STYLE',
     'ITEM_SELECTED_STYLE'
 ] 
\ No newline at end of file
@@ -5,19 +5,13 @@ Initialization module for the specific components styles package.
 from .extensions import (
     STATUS_STYLE,
     PAGINATION_STYLE,
-    ASSET_TITLE_STYLE,
-    ASSET_INFO_STYLE,
-    COPY_BUTTON_STYLE,
-    ICON_PLACEHOLDER_STYLE,
+    ASSET_RESULTS_STYLE,
     CANCEL_BUTTON_STYLE
 )
 
 __all__ = [
     'STATUS_STYLE',
     'PAGINATION_STYLE',
-    'ASSET_TITLE_STYLE',
-    'ASSET_INFO_STYLE',
-    'COPY_BUTTON_STYLE',
-    'ICON_PLACEHOLDER_STYLE',
+    'ASSET_RESULTS_STYLE',
     'CANCEL_BUTTON_STYLE'
 ] 
\ No newline at end of file
@@ -4,6 +4,7 @@ Includes styles for cards, pagination and other specific interface components.
 """
 
 from ..colors import COLORS
+from ..inputs import CHECKBOX_STYLE
 
 # Style for search status
 STATUS_STYLE = f"""
@@ -38,26 +39,38 @@ PAGINATION_STYLE = f"""
     }}
 """
 
-# Style for asset titles
-ASSET_TITLE_STYLE = f"""
-    QLabel {{
+# Style for the results container, applied once to style all asset rows.
+# Row widgets select their rule through the "class" dynamic property;
+# the row checkboxes reuse CHECKBOX_STYLE.
+ASSET_RESULTS_STYLE = f"""
+    QWidget {{
+        background-color: {COLORS["bg_dark"]};
+    }}
+    QLabel[class="assetTitle"] {{
         color: {COLORS["text_primary"]};
         font-weight: bold;
         font-size: 13px;
     }}
-"""
-
-# Style for asset info
-ASSET_INFO_STYLE = f"""
-    QLabel {{
+    QLabel[class="assetInfo"] {{
         color: {COLORS["text_secondary"]};
         font-size: 11px;
     }}
-"""
-
-# Style for ID copy buttons
-COPY_BUTTON_STYLE = f"""
-    QPushButton {{
+    QLabel[class="iconPlaceholder"] {{
+        background-color: {COLORS["bg_dark"]};
+        border: 1px solid {COLORS["border"]};
+        border-radius: 4px;
+        color: {COLORS["text_secondary"]};
+        padding: 2px;
+        qproperty-alignment: AlignCenter;
+    }}
+    QLabel[class="iconError"] {{
+        background-color: {COLORS["bg_dark"]};
+        border: 1px solid {COLORS["error"]};
+        border-radius: 4px;
+        color: {COLORS["error"]};
+        qproperty-alignment: AlignCenter;
+    }}
+    QPushButton[class="copyIdBtn"] {{
         background-color: {COLORS["bg_content"]};
         color: {COLORS["text_primary"]};
         border: 1px solid {COLORS["border"]};
@@ -65,26 +78,14 @@ COPY_BUTTON_STYLE = f"""
         padding: 4px;
         font-size: 11px;
     }}
-    QPushButton:hover {{
+    QPushButton[class="copyIdBtn"]:hover {{
         border-color: {COLORS["accent"]};
         color: white;
     }}
-    QPushButton:pressed {{
+    QPushButton[class="copyIdBtn"]:pressed {{
         background-color: {COLORS["accent_hover"]};
     }}
-"""
-
-# Style for unloaded icons
-ICON_PLACEHOLDER_STYLE = f"""
-    QLabel {{
-        background-color: {COLORS["bg_dark"]};
-        border: 1px solid {COLORS["border"]};
-        border-radius: 4px;
-        color: {COLORS["text_secondary"]};
-        padding: 2px;
-        qproperty-alignment: AlignCenter;
-    }}
-"""
+""" + CHECKBOX_STYLE
 
 # Style for cancel button
 CANCEL_BUTTON_STYLE = f"""
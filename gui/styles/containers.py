@@ -1,9 +1,10 @@
 """
 Definition of styles for container-type components.
-Includes styles for GroupBox, ListWidget, Frame and Dialog.
+Includes styles for GroupBox, ListWidget (plain and checkable), Frame and Dialog.
 """
 
 from .colors import COLORS
+from .inputs import indicator_style
 
 # Stile per QGroupBox
 GROUP_BOX_STYLE = f"""
@@ -53,6 +54,13 @@ LIST_WIDGET_STYLE = f"""
     }}
 """
 
+# Stile per QListWidget con elementi spuntabili (stessi indicatori di CHECKBOX_STYLE)
+CHECKABLE_LIST_WIDGET_STYLE = LIST_WIDGET_STYLE + f"""
+    QListWidget::item:disabled {{
+        color: {COLORS["text_secondary"]};
+    }}
+""" + indicator_style("QListWidget")
+
 # Stile per QFrame
 FRAME_STYLE = f"""
     QFrame {{
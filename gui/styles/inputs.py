@@ -81,31 +81,36 @@ INPUT_INVALID_STYLE = f"""
     }}
 """
 
-# Stile per QCheckBox
-CHECKBOX_STYLE = f"""
-    QCheckBox {{
-        color: {COLORS["text_primary"]};
-        background-color: {COLORS["bg_content"]};
-        spacing: 8px;
-    }}
-    
-    QCheckBox::indicator {{
+# Regole degli indicatori di spunta, condivise da QCheckBox e QListWidget
+def indicator_style(widget):
+    """Returns the check indicator rules for the given widget selector."""
+    return f"""
+    {widget}::indicator {{
         width: 18px;
         height: 18px;
         border: 1px solid {COLORS["border"]};
         border-radius: 3px;
     }}
     
-    QCheckBox::indicator:unchecked {{
+    {widget}::indicator:unchecked {{
         background-color: {COLORS["bg_content"]};
     }}
     
-    QCheckBox::indicator:checked {{
+    {widget}::indicator:checked {{
         background-color: {COLORS["accent"]};
         image: url("assets/icons/check.png");
     }}
     
-    QCheckBox::indicator:hover {{
+    {widget}::indicator:hover {{
         border: 1px solid {COLORS["accent"]};
     }}
-""" 
\ No newline at end of file
+"""
+
+# Stile per QCheckBox
+CHECKBOX_STYLE = f"""
+    QCheckBox {{
+        color: {COLORS["text_primary"]};
+        background-color: {COLORS["bg_content"]};
+        spacing: 8px;
+    }}
+""" + indicator_style("QCheckBox")
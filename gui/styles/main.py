@@ -49,11 +49,42 @@ MAIN_STYLE = f"""
         border-top: 1px solid {COLORS["border"]};
     }}
     
+    QStatusBar#statusBar {{
+        padding: 2px;
+    }}
+    
+    QToolButton#settingsBtn {{
+        background-color: transparent;
+        border: none;
+        color: {COLORS["text_primary"]};
+    }}
+    
+    QToolButton#settingsBtn:hover {{
+        background-color: {COLORS["muted"]};
+        border-radius: 4px;
+    }}
+    
+    QWidget#navPanel {{
+        background-color: {COLORS["bg_dark"]};
+        border-radius: 8px;
+    }}
+    
+    QStackedWidget#pagesStack {{
+        background-color: {COLORS["bg_content"]};
+        border-radius: 8px;
+        padding: 10px;
+    }}
+    
     QLabel {{
         background-color: transparent;
         color: {COLORS["text_primary"]};
     }}
     
+    QLabel#versionLabel {{
+        color: {COLORS["muted"]};
+        padding-right: 5px;
+    }}
+    
     QScrollBar:vertical {{
         background-color: {COLORS["bg_dark"]};
         width: 12px;
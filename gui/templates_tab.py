@@ -69,6 +69,7 @@ class TemplatesTab(QWidget):
         """
         super().__init__()
         self.data_manager = data_manager # Store DataManager instance
+        self._get_godot_path = data_manager.get_godot_path # Bound DataManager accessor
         self.asset_widgets: Dict[str, ClickableAssetFrame] = {} # Stores asset frames by ID
         self.icon_labels: Dict[str, QLabel] = {} # Stores icon labels by asset ID
         self.thread_pool = QThreadPool() # Thread pool for icon downloads
@@ -236,7 +237,7 @@ class TemplatesTab(QWidget):
         self.current_page = page
 
         # Get Godot version filter from DataManager's default path
-        current_godot_path = self.data_manager.get_godot_path()
+        current_godot_path = self._get_godot_path()
         godot_version_filter = get_godot_version_string(current_godot_path)
 
         logging.info(
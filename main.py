@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # main.py (Main Entry Point - v1.2 - Online Icon)
 
+import atexit
 import logging
 import os
 import platform
@@ -10,6 +11,7 @@ from pathlib import Path
 
 # Import QApplication and QMessageBox first for error fallback
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPixmapCache
 
 # Add the project root directory to sys.path
 # This allows absolute imports like 'from validators import ...' from submodules like 'gui'
@@ -121,6 +123,9 @@ def main():
         # Create DataManager instance (loads data internally)
         logging.debug("Creating DataManager instance...")
         data_manager = DataManager()
+        # Saves are debounced on a daemon timer: write pending changes on every exit path
+        # (fatal errors, startup sync before the window exists), not only on window close
+        atexit.register(data_manager.flush_pending_save)
 
         # Removed ensuring Godot versions directory exists at startup.
         # This will be checked/created only when a download is requested.
@@ -145,6 +150,7 @@ def main():
         logging.debug("Creating QApplication...")
         app = QApplication(sys.argv)
         app.setStyle("Fusion") # Optional: Set application style
+        QPixmapCache.setCacheLimit(20480) # 20 MiB for scaled icons shared by the tabs
 
         logging.debug("Creating MainWindow...")
         # Pass the DataManager instance to the MainWindow
@@ -10,7 +10,8 @@ import sys
 import tempfile # Added
 from pathlib import Path
 import re
-from typing import Dict, List, Optional, Set
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
 import requests
 
 from PyQt6.QtCore import QCoreApplication, QThread, QObject, pyqtSignal
@@ -27,6 +28,7 @@ from api_clients import fetch_asset_details_sync  # Per ExtensionInstaller
 # Constants
 DEFAULT_ICON_NAME = "icon.svg"
 GODOT_ICON_URL = "https://raw.githubusercontent.com/godotengine/godot/master/icon.svg" # Official Godot icon URL
+SCAN_SKIPPED_DIR_NAMES = frozenset({".git", ".venv", "node_modules", "__pycache__", "cache", "assets"}) # Lowercase folder names never descended into
 
 
 # --- Godot Path Validation and Launching Functions ---
@@ -216,7 +218,19 @@ def get_project_name_from_file(project_path: Path) -> Optional[str]:
     project_file = project_path / "project.godot"
     if not project_file.is_file():
         return None # project.godot not found
+    return _read_project_name(project_file)
 
+
+def _read_project_name(project_file) -> Optional[str]:
+    """
+    Extracts the 'config/name' value from an existing project.godot file.
+
+    Args:
+        project_file: Path (or path string) of the project.godot file.
+
+    Returns:
+        The project name string if found, otherwise None.
+    """
     try:
         with open(project_file, "r", encoding="utf-8") as f:
             for line in f:
@@ -260,21 +274,38 @@ def scan_projects_folder(folder_path: Path, recursive: bool = True) -> Dict[str,
         return found_projects
 
     logging.info(f"Scanning projects folder{' recursively' if recursive else ''}: {folder_path}")
-    folders_to_scan = [folder_path]
-    scanned_folders: Set[Path] = set()
+    # Plain path strings + os.scandir: DirEntry answers is_dir() from the directory read itself,
+    # and seeing project.godot among the entries replaces a separate stat per folder
+    folders_to_scan = deque([os.fspath(folder_path)])
+    scanned_folders: Set[str] = set()
 
     while folders_to_scan:
-        current_folder = folders_to_scan.pop(0)
+        current_folder = folders_to_scan.popleft()
         if current_folder in scanned_folders:
             continue # Avoid rescanning or infinite loops with symlinks
         scanned_folders.add(current_folder)
 
         logging.debug(f"Scanning directory: {current_folder}")
         try:
+            project_file = None
+            subfolders: List[str] = []
+            with os.scandir(current_folder) as entries:
+                for entry in entries:
+                    if entry.name == "project.godot":
+                        if entry.is_file():
+                            project_file = entry.path
+                    elif recursive and entry.is_dir():
+                        # Basic check to avoid common large/unrelated directories
+                        # TODO: Make this configurable or more robust?
+                        if entry.name.lower() in SCAN_SKIPPED_DIR_NAMES:
+                            logging.debug(f"Skipping common directory: {entry.name}")
+                            continue
+                        subfolders.append(entry.path)
+
             # Check if the current folder itself is a Godot project
-            project_name = get_project_name_from_file(current_folder)
-            project_path_str = str(current_folder.resolve()) # Store resolved path
+            project_name = _read_project_name(project_file) if project_file else None
             if project_name:
+                project_path_str = str(Path(current_folder).resolve()) # Store resolved path
                 if project_name in found_projects:
                     logging.warning(
                         f"Duplicate project name '{project_name}' found during scan. "
@@ -289,19 +320,8 @@ def scan_projects_folder(folder_path: Path, recursive: bool = True) -> Dict[str,
                 # Change this logic if nested projects are desired.
                 continue # Skip scanning subfolders of a found project folder
 
-            # Iterate through items in the current folder if recursion is enabled
-            if recursive:
-                for item in current_folder.iterdir():
-                    if item.is_dir(): # Check only subdirectories
-                        # Basic check to avoid common large/unrelated directories
-                        # TODO: Make this configurable or more robust?
-                        if item.name.lower() in [".git", ".venv", "node_modules", "__pycache__", "cache", "assets"]:
-                            logging.debug(f"Skipping common directory: {item.name}")
-                            continue
-                        if item not in scanned_folders:
-                            folders_to_scan.append(item)
-                    # else: # Check if the item is project.godot (alternative to get_project_name_from_file first)
-                    #    pass
+            # Queue subdirectories if recursion is enabled (list is empty otherwise)
+            folders_to_scan.extend(f for f in subfolders if f not in scanned_folders)
 
         except PermissionError:
              logging.warning(f"Permission denied scanning {current_folder}. Skipping.")
@@ -800,27 +820,22 @@ def install_extensions_logic(
 
 
 # --- Project Synchronization Logic ---
-def synchronize_projects_with_default_folder(data_manager: DataManager) -> bool:
+def scan_default_projects_folder(default_folder_str: Optional[str]) -> Optional[Tuple[Path, Dict[str, str]]]:
     """
-    Synchronizes the stored project list with the contents of the default projects folder.
+    Resolves the default projects folder and scans it for Godot projects.
 
-    - Adds projects found in the folder but not in the stored list.
-    - Updates names if a project in the folder has a different name than stored.
-    - Removes projects from the stored list if they were previously in the default folder
-      but are no longer found there.
-    - Removes projects from the stored list if they were added manually (outside the
-      default folder) but their path no longer exists.
+    Touches only the filesystem, never DataManager, so it can run in a worker thread;
+    the result is applied with apply_projects_folder_scan().
 
     Args:
-        data_manager: The DataManager instance holding the stored project data.
+        default_folder_str: The configured default projects folder (may be None/empty).
 
     Returns:
-        True if any changes were made to the stored project list, False otherwise.
+        A tuple (resolved_default_folder, {name: path_str}), or None if the sync should be skipped.
     """
-    default_folder_str = data_manager.get_default_projects_folder()
     if not default_folder_str:
         logging.info("Sync skipped: Default projects folder is not set.")
-        return False
+        return None
 
     try:
         # Resolve the default folder path once
@@ -829,19 +844,60 @@ def synchronize_projects_with_default_folder(data_manager: DataManager) -> bool:
         logging.error(
             f"Sync failed: Default projects folder path '{default_folder_str}' is invalid: {e}"
         )
-        return False
+        return None
 
     if not default_folder_path.is_dir():
         logging.warning(
             f"Sync skipped: Default projects folder '{default_folder_path}' is not a valid directory."
         )
-        return False
+        return None
 
     logging.info(f"Starting project synchronization with folder: {default_folder_path}")
 
     # 1. Scan the default folder
-    scanned_projects = scan_projects_folder(default_folder_path) # {name: path_str}
+    return default_folder_path, scan_projects_folder(default_folder_path) # {name: path_str}
 
+
+def synchronize_projects_with_default_folder(data_manager: DataManager) -> bool:
+    """
+    Synchronizes the stored project list with the contents of the default projects folder.
+
+    - Adds projects found in the folder but not in the stored list.
+    - Updates names if a project in the folder has a different name than stored.
+    - Removes projects from the stored list if they were previously in the default folder
+      but are no longer found there.
+    - Removes projects from the stored list if they were added manually (outside the
+      default folder) but their path no longer exists.
+
+    Args:
+        data_manager: The DataManager instance holding the stored project data.
+
+    Returns:
+        True if any changes were made to the stored project list, False otherwise.
+    """
+    scan_result = scan_default_projects_folder(data_manager.get_default_projects_folder())
+    if scan_result is None:
+        return False
+    default_folder_path, scanned_projects = scan_result
+    return apply_projects_folder_scan(data_manager, default_folder_path, scanned_projects)
+
+
+def apply_projects_folder_scan(data_manager: DataManager, default_folder_path: Path,
+                               scanned_projects: Dict[str, str]) -> bool:
+    """
+    Applies the result of scan_default_projects_folder() to the stored project list
+    (see synchronize_projects_with_default_folder for the rules).
+
+    Must run on the thread that owns DataManager's data (the GUI thread once the app is up).
+
+    Args:
+        data_manager: The DataManager instance holding the stored project data.
+        default_folder_path: The resolved default projects folder that was scanned.
+        scanned_projects: The scan result {name: path_str}.
+
+    Returns:
+        True if any changes were made to the stored project list, False otherwise.
+    """
     # 2. Get currently stored projects
     stored_projects = data_manager.get_projects() # {name: path_str}
     updated = False
@@ -871,7 +927,8 @@ def synchronize_projects_with_default_folder(data_manager: DataManager) -> bool:
 
     scanned_paths_set = set(scanned_paths_map.keys())
 
-    # 4. Add or Update projects found during scan
+    # 4. Add or Update projects found during scan (additions are applied together below)
+    projects_to_add: List[Tuple[str, str]] = []
     for scanned_path, scanned_name in scanned_paths_map.items():
         if scanned_path in stored_paths_map:
             # Project path exists in storage. Check if the name matches.
@@ -881,17 +938,18 @@ def synchronize_projects_with_default_folder(data_manager: DataManager) -> bool:
                 logging.info(
                     f"Sync: Updating name for project at '{scanned_path}'. '{stored_name}' -> '{scanned_name}'."
                 )
-                # DataManager handles saving internally
                 data_manager.remove_project(stored_name) # Remove old entry
-                data_manager.add_project(scanned_name, str(scanned_path)) # Add new entry
+                projects_to_add.append((scanned_name, str(scanned_path))) # Add new entry
                 updated = True
         else:
             # New project found in the folder that wasn't stored before.
             logging.info(
                 f"Sync: Adding new project found in folder: '{scanned_name}' ({scanned_path})."
             )
-            data_manager.add_project(scanned_name, str(scanned_path))
+            projects_to_add.append((scanned_name, str(scanned_path)))
             updated = True
+    # New and renamed entries are added together with a single save request
+    data_manager.add_projects_bulk(projects_to_add)
 
     # 5. Remove stale projects from storage
     projects_to_remove: List[str] = []
@@ -8,12 +8,13 @@ import tempfile
 import shutil
 import zipfile
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 import requests
-from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThread, QUrl, pyqtSignal
-from PyQt6.QtGui import QPixmap, QIcon
+from PyQt6.QtCore import QObject, QRunnable, QSize, Qt, QThread, QThreadPool, QUrl, pyqtSignal
+from PyQt6.QtGui import QPixmap, QIcon, QImage
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
 # Constants
@@ -483,6 +484,7 @@ class IconDownloaderSignals(QObject):
     """Container for signals emitted by IconDownloader."""
     finished = pyqtSignal()
     icon_ready = pyqtSignal(str, str) # asset_id, cache_path
+    image_ready = pyqtSignal(str, QImage) # asset_id, decoded and scaled image (only when scale_to is set)
     error = pyqtSignal(str, str) # asset_id, error_message
 
 
@@ -494,7 +496,14 @@ class IconDownloader(QRunnable):
     and emits signals indicating success or failure. Uses the asset ID
     to generate a safe filename for caching.
     """
-    def __init__(self, asset_id, icon_url):
+    def __init__(
+        self,
+        asset_id,
+        icon_url,
+        scale_to: Optional[QSize] = None,
+        signals: Optional[IconDownloaderSignals] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ):
         """
         Initializes the IconDownloader.
 
@@ -502,11 +511,18 @@ class IconDownloader(QRunnable):
             asset_id: The unique identifier for the asset (used for filename).
                       Can be a number or a URL string (for previews).
             icon_url: The URL from which to download the icon.
+            scale_to: If set, the icon is also decoded and scaled in the worker thread
+                      and delivered through image_ready instead of icon_ready.
+            signals: Optional shared signals object (used by IconDownloadQueue); a new one is created if None.
+            is_cancelled: Optional callable; if it returns True once the file is cached, decoding is skipped
+                          and no signal is emitted (the result is no longer wanted).
         """
         super().__init__()
         self.internal_id = str(asset_id) # Store original ID for signals
         self.icon_url = icon_url
-        self.signals = IconDownloaderSignals()
+        self.scale_to = scale_to
+        self.signals = signals if signals is not None else IconDownloaderSignals()
+        self.is_cancelled = is_cancelled
 
         # Determine file extension
         url_path = Path(QUrl(icon_url).path())
@@ -542,8 +558,7 @@ class IconDownloader(QRunnable):
                 logging.debug(
                     f"Icon {self.internal_id} found in cache: {self.cache_path}"
                 )
-                # Emit signal with original ID
-                self.signals.icon_ready.emit(self.internal_id, str(self.cache_path))
+                self._emit_ready()
             else:
                 # Download the icon
                 logging.debug(f"Downloading icon {self.internal_id} from {self.icon_url}")
@@ -564,8 +579,7 @@ class IconDownloader(QRunnable):
                     logging.debug(
                         f"Icon {self.internal_id} downloaded to {self.cache_path}"
                     )
-                    # Emit signal with original ID
-                    self.signals.icon_ready.emit(self.internal_id, str(self.cache_path))
+                    self._emit_ready()
                 else:
                     # Handle empty download case
                     logging.warning(
@@ -587,3 +601,97 @@ class IconDownloader(QRunnable):
                 self.signals.error.emit(self.internal_id, error_msg)
             # Always emit finished signal
             self.signals.finished.emit()
+
+    def _emit_ready(self):
+        """Emits the cached icon path, or the decoded and scaled image if scale_to is set."""
+        if self.is_cancelled is not None and self.is_cancelled():
+            logging.debug(f"Icon {self.internal_id} no longer needed, skipping decode.")
+            return
+        if self.scale_to is None:
+            # Emit signal with original ID
+            self.signals.icon_ready.emit(self.internal_id, str(self.cache_path))
+            return
+
+        # QImage (unlike QPixmap) can be used outside the GUI thread
+        image = QImage(str(self.cache_path))
+        if image.isNull():
+            raise ValueError("Cached icon could not be decoded.")
+        # Large icons: cheap fast downscale to 2x the target first, so the smooth pass filters fewer pixels
+        if image.width() > self.scale_to.width() * 4 or image.height() > self.scale_to.height() * 4:
+            image = image.scaled(
+                self.scale_to * 2, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation
+            )
+        image = image.scaled(
+            self.scale_to, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+        )
+        self.signals.image_ready.emit(self.internal_id, image)
+
+
+class IconDownloadQueue:
+    """
+    A queue of icon downloads processed by a small, fixed number of workers.
+
+    Instead of one IconDownloader task (and one signals object) per icon, requests are
+    appended to a shared deque and up to `max_workers` IconQueueWorker tasks drain it,
+    emitting results through a single shared IconDownloaderSignals instance.
+    """
+    def __init__(self, thread_pool: QThreadPool, max_workers: int = 4, scale_to: Optional[QSize] = None):
+        """
+        Initializes the IconDownloadQueue.
+
+        Args:
+            thread_pool: The pool on which the workers are started.
+            max_workers: Maximum number of workers draining the queue at the same time.
+            scale_to: Passed to each download (see IconDownloader).
+        """
+        self.thread_pool = thread_pool
+        self.max_workers = max_workers
+        self.scale_to = scale_to
+        self.signals = IconDownloaderSignals() # Shared by all downloads; connect to it once
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._active_workers = 0
+        self.generation = 0 # Incremented by clear(); downloads of older generations are not decoded
+
+    def enqueue(self, asset_id, icon_url):
+        """Queues an icon download and starts a worker if fewer than max_workers are running."""
+        with self._lock:
+            self._queue.append((self.generation, str(asset_id), icon_url))
+            if self._active_workers >= self.max_workers:
+                return
+            self._active_workers += 1
+        self.thread_pool.start(IconQueueWorker(self))
+
+    def clear(self):
+        """Drops all queued downloads; those already running are downloaded but not decoded."""
+        with self._lock:
+            self._queue.clear()
+            self.generation += 1
+
+    def _next(self):
+        """Returns the next queued download, or None (and retires the calling worker) if the queue is empty."""
+        with self._lock:
+            if self._queue:
+                return self._queue.popleft()
+            self._active_workers -= 1
+            return None
+
+
+class IconQueueWorker(QRunnable):
+    """A QRunnable draining an IconDownloadQueue until it is empty."""
+    def __init__(self, download_queue: IconDownloadQueue):
+        super().__init__()
+        self.download_queue = download_queue
+
+    def run(self):
+        """Processes queued downloads one after the other in this worker thread."""
+        while True:
+            item = self.download_queue._next()
+            if item is None:
+                return
+            generation, asset_id, icon_url = item
+            # Run the download inline; results are emitted through the queue's shared signals
+            IconDownloader(
+                asset_id, icon_url, scale_to=self.download_queue.scale_to, signals=self.download_queue.signals,
+                is_cancelled=lambda: generation != self.download_queue.generation,
+            ).run()